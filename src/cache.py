@@ -0,0 +1,247 @@
+"""
+Run-level result cache for the Automaton Auditor detective and judicial layers.
+
+Re-grading the same submission re-clones the repository, re-parses the
+PDF, re-runs every protocol and re-asks every judge even though nothing
+has changed.  This module stores that output on disk under
+content-addressed keys:
+
+* RepoInvestigator — the repository URL *and* the commit its remote
+  ``HEAD`` resolves to, so a new push is always re-analysed.
+* DocAnalyst — the PDF path, the SHA-256 of its bytes and the PDF
+  backend, so an edited report is always re-parsed.
+* Judges — the model, temperature and full prompt text, so any change to
+  the evidence, rubric or persona doctrine is always re-judged.
+
+Storage
+-------
+One JSON file per key under ``$AUDITOR_CACHE_DIR`` (default
+``~/.cache/automaton-auditor/evidence``), judge opinions in its
+``opinions/`` subdirectory.  Entries are plain ``model_dump()`` payloads —
+no pickle, so a cache file can never execute code on load.  Set
+``AUDITOR_EVIDENCE_CACHE=0`` to disable the detective entries and
+``AUDITOR_JUDGE_CACHE=0`` to always query the judge LLM.
+
+A cached opinion is a single sample, so re-runs repeat it rather than
+re-sampling.  Opinions therefore expire after ``AUDITOR_JUDGE_CACHE_DAYS``
+(default 7), and at most ``AUDITOR_JUDGE_CACHE_ENTRIES`` (default 5000) are
+kept; the first opinion stored by a process prunes the rest.
+
+Every failure (unreadable directory, corrupt entry, schema drift) is
+treated as a cache miss; the cache never breaks an audit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.state import Evidence, JudicialOpinion
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+#: Bumped whenever the forensic protocols change what they emit
+_CACHE_VERSION: int = 1
+
+#: Directory holding one ``<sha256>.json`` entry per cache key
+_CACHE_DIR: Path = Path(
+    os.environ.get("AUDITOR_CACHE_DIR")
+    or Path.home() / ".cache" / "automaton-auditor" / "evidence"
+)
+
+#: Master switch — ``AUDITOR_EVIDENCE_CACHE=0`` turns the cache off
+_ENABLED: bool = os.environ.get("AUDITOR_EVIDENCE_CACHE", "1") != "0"
+
+#: ``AUDITOR_JUDGE_CACHE=0`` forces a fresh LLM call for every opinion
+_JUDGE_ENABLED: bool = os.environ.get("AUDITOR_JUDGE_CACHE", "1") != "0"
+
+#: Opinion entries, kept apart from evidence so they can be pruned alone
+_OPINION_DIR: Path = _CACHE_DIR / "opinions"
+
+#: Age after which a cached opinion is re-sampled (``AUDITOR_JUDGE_CACHE_DAYS``)
+_JUDGE_MAX_AGE_SECONDS: float = float(os.environ.get("AUDITOR_JUDGE_CACHE_DAYS", "7")) * 86400
+
+#: Most opinion entries kept; the oldest beyond this are pruned
+_JUDGE_MAX_ENTRIES: int = int(os.environ.get("AUDITOR_JUDGE_CACHE_ENTRIES", "5000"))
+
+#: Set once this process has pruned the opinion directory
+_opinions_pruned: bool = False
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def evidence_enabled() -> bool:
+    """Return whether detective evidence is cached (``AUDITOR_EVIDENCE_CACHE``)."""
+    return _ENABLED
+
+
+def evidence_key(repo_url: str, revision: str) -> str:
+    """Return the content-addressed cache key for *repo_url* at *revision*."""
+    raw = f"{_CACHE_VERSION}\0{repo_url.rstrip('/')}\0{revision}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def document_key(pdf_path: str, backend: str) -> str | None:
+    """Return the cache key for the PDF at *pdf_path*, or ``None`` if unreadable.
+
+    Keyed on the file's bytes, so edits invalidate it; the path is part of
+    the key because cached Evidence records it as ``location``.
+    """
+    try:
+        with open(pdf_path, "rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").hexdigest()
+    except OSError:
+        return None
+    raw = f"{_CACHE_VERSION}\0pdf\0{pdf_path}\0{backend}\0{digest}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def opinion_key(
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    criterion_id: str = "",
+) -> str:
+    """Return the cache key for one judge call with exactly these inputs.
+
+    A batched call answers several criteria from one prompt; *criterion_id*
+    then names the opinion within it.
+    """
+    raw = (
+        f"{_CACHE_VERSION}\0judge\0{model}\0{temperature!r}\0{system_prompt}"
+        f"\0{user_prompt}\0{criterion_id}"
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> tuple[dict[str, list[Evidence]], list[str]] | None:
+    """Return the cached ``(evidence_map, repo_files)`` for *key*, or ``None``."""
+    if not _ENABLED:
+        return None
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        payload: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        evidence_map = {
+            criterion_id: [Evidence.model_validate(item) for item in items]
+            for criterion_id, items in payload["evidences"].items()
+        }
+        repo_files: list[str] = payload["repo_files"]
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, TypeError, ValueError, ValidationError) as exc:
+        logger.warning("[EvidenceCache] Ignoring unreadable entry %s: %s", path, exc)
+        return None
+    return evidence_map, repo_files
+
+
+def get_opinion(key: str) -> JudicialOpinion | None:
+    """Return the cached JudicialOpinion for *key*, or ``None``."""
+    if not _JUDGE_ENABLED:
+        return None
+    path = _OPINION_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > _JUDGE_MAX_AGE_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        payload: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        return JudicialOpinion.model_validate(payload["opinion"])
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, TypeError, ValueError, ValidationError) as exc:
+        logger.warning("[EvidenceCache] Ignoring unreadable entry %s: %s", path, exc)
+        return None
+
+
+def put(
+    key: str,
+    evidence_map: dict[str, list[Evidence]],
+    repo_files: list[str] | None = None,
+) -> None:
+    """Store *evidence_map* (and *repo_files*) under *key*; errors are logged, not raised.
+
+    Written to a temporary sibling and renamed into place, so a concurrent
+    reader sees either the old entry or the complete new one.
+    """
+    if not _ENABLED:
+        return
+    payload = {
+        "evidences": {
+            criterion_id: [ev.model_dump(mode="json") for ev in evs]
+            for criterion_id, evs in evidence_map.items()
+        },
+        "repo_files": repo_files or [],
+    }
+    _write(_CACHE_DIR / f"{key}.json", payload)
+
+
+def put_opinion(key: str, opinion: JudicialOpinion) -> None:
+    """Store *opinion* under *key*; errors are logged, not raised."""
+    if _JUDGE_ENABLED:
+        _write(_OPINION_DIR / f"{key}.json", {"opinion": opinion.model_dump(mode="json")})
+        _prune_opinions()
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _write(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically write *payload* as the entry at *path*."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("[EvidenceCache] Could not write %s: %s", path, exc)
+        tmp.unlink(missing_ok=True)
+
+
+def _prune_opinions() -> None:
+    """Drop expired opinions, then the oldest beyond the entry cap — once per process."""
+    global _opinions_pruned
+    if _opinions_pruned:
+        return
+    _opinions_pruned = True
+    cutoff = time.time() - _JUDGE_MAX_AGE_SECONDS
+    entries: list[tuple[float, Path]] = []
+    try:
+        for entry in _OPINION_DIR.glob("*.json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry))
+            except FileNotFoundError:
+                continue  # removed by a concurrent prune
+        excess = len(entries) - _JUDGE_MAX_ENTRIES
+        for index, (mtime, entry) in enumerate(sorted(entries)):
+            if index >= excess and mtime >= cutoff:
+                break
+            entry.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("[EvidenceCache] Could not prune %s: %s", _OPINION_DIR, exc)
+
+
+__all__: list[str] = [
+    "document_key",
+    "evidence_enabled",
+    "evidence_key",
+    "get",
+    "get_opinion",
+    "opinion_key",
+    "put",
+    "put_opinion",
+]
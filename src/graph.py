@@ -74,21 +74,28 @@ Automatic when ``LANGCHAIN_TRACING_V2=true`` is set in the environment.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import os
+import re
+import sys
+from itertools import chain, compress
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
-from langgraph.graph import END, START, StateGraph
+try:  # optional accelerator for the rubric parse — stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
-from src.nodes.detectives import doc_analyst_node, repo_investigator_node, vision_inspector_node
-from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
-from src.nodes.justice import chief_justice_node
 from src.state import AgentState, Evidence, JudicialOpinion
 
-load_dotenv()
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -129,8 +136,61 @@ REQUIRED_INTERIM_CRITERIA: frozenset[str] = _REPO_CRITERIA | _PDF_CRITERIA | _VI
 #: Full rubric (detective + judicial coverage)
 REQUIRED_ALL_CRITERIA: frozenset[str] = REQUIRED_INTERIM_CRITERIA
 
-#: Judge personas expected in state["opinions"] after the judicial phase
-_EXPECTED_JUDGES: frozenset[str] = frozenset({"Prosecutor", "Defense", "TechLead"})
+#: Judge personas expected in state["opinions"] after the judicial phase,
+#: one bit each — per-criterion coverage is tracked as an int mask
+_JUDGE_BIT: dict[str, int] = {"Prosecutor": 1, "Defense": 2, "TechLead": 4}
+
+#: Mask value meaning all three judges submitted an opinion
+_ALL_JUDGES_MASK: int = 7
+
+#: Backslash → slash translation table for path normalisation (C-level ``str.translate``)
+_BSLASH_TRANS: dict[int, str] = str.maketrans("\\", "/")
+
+#: C-level accessor for ``Evidence.found`` used in aggregate counts
+_EV_FOUND: Callable[[Evidence], bool] = attrgetter("found")
+
+#: One ``claimed: <path>`` line in DocAnalyst's report_accuracy Evidence.content
+_CLAIMED_RE: re.Pattern[str] = re.compile(r"^[ \t]*claimed:[ \t]*(\S.*?)[ \t]*$", re.MULTILINE)
+
+# ---------------------------------------------------------------------------
+# Utility: deferred log arguments
+# ---------------------------------------------------------------------------
+
+
+class _Lazy:
+    """Log argument whose value is computed only when a handler formats it.
+
+    ``logger.warning("%s", _Lazy(lambda: sorted(missing)))`` skips the sort
+    entirely when the record is filtered out by level.
+    """
+
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        self._fn = fn
+
+    def __str__(self) -> str:
+        return str(self._fn())
+
+
+# ---------------------------------------------------------------------------
+# Utility: deferred .env loading
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def _ensure_env_loaded() -> None:
+    """Load ``.env`` into ``os.environ`` once, on first build or audit run.
+
+    Kept out of module import so that importing ``src.graph`` (tooling,
+    workers, tests) never touches the filesystem or picks up a stray
+    ``.env``.  Runs before the node modules are imported, so their
+    environment-driven settings still see ``.env`` values.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 # ---------------------------------------------------------------------------
 # Utility: load rubric dimensions from rubric.json
@@ -139,14 +199,32 @@ _EXPECTED_JUDGES: frozenset[str] = frozenset({"Prosecutor", "Defense", "TechLead
 _RUBRIC_PATH: Path = Path(__file__).parent.parent / "rubric" / "rubric.json"
 
 
+#: (mtime, dimensions) of the last successful rubric.json parse
+_RUBRIC_CACHE: tuple[float, list[dict[str, Any]]] | None = None
+
+
 def _load_rubric_dimensions() -> list[dict[str, Any]]:
-    """Load the rubric.json dimensions array; return empty list on failure."""
+    """Load the rubric.json dimensions array; return empty list on failure.
+
+    Cached per process and keyed on the file's mtime: repeat calls cost one
+    ``stat()`` and return the shared list, while an edited rubric is picked
+    up on the next audit.  No node mutates the returned list.
+    """
+    global _RUBRIC_CACHE
     try:
-        data = json.loads(_RUBRIC_PATH.read_text(encoding="utf-8"))
-        return data.get("dimensions", [])
-    except (OSError, json.JSONDecodeError) as exc:
+        mtime = _RUBRIC_PATH.stat().st_mtime
+        if _RUBRIC_CACHE is not None and _RUBRIC_CACHE[0] == mtime:
+            return _RUBRIC_CACHE[1]
+        if orjson is not None:
+            data = orjson.loads(_RUBRIC_PATH.read_bytes())
+        else:
+            data = json.loads(_RUBRIC_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:  # orjson.JSONDecodeError subclasses it
         logger.warning("Could not load rubric from %s: %s", _RUBRIC_PATH, exc)
         return []
+    dimensions: list[dict[str, Any]] = data.get("dimensions", [])
+    _RUBRIC_CACHE = (mtime, dimensions)
+    return dimensions
 
 
 # ---------------------------------------------------------------------------
@@ -154,16 +232,29 @@ def _load_rubric_dimensions() -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+def _summarize_evidences(evidences: dict[str, list[Evidence]]) -> tuple[int, int]:
+    """Return ``(total, found)`` item counts in a single walk of *evidences*.
+
+    ``Evidence.found`` is a bool, so summing it per list counts the hits
+    without building a flattened copy of every Evidence.
+    """
+    total = found = 0
+    for evs in evidences.values():
+        total += len(evs)
+        found += sum(map(_EV_FOUND, evs))
+    return total, found
+
+
 def evidence_aggregator_node(state: AgentState) -> dict[str, Any]:
     """Detective fan-in node — runs after both detective branches complete.
 
     Responsibilities
     ----------------
-    1. **Completeness check** — log warnings for any missing criteria.
+    1. **Completeness check** — one summary record, a warning when any
+       criteria are missing.
     2. **Secondary cross-reference** — use repo file locations from
        RepoInvestigator to finalise the report_accuracy analysis that
        DocAnalyst deferred during parallel execution.
-    3. **Summary logging** — emit concise audit progress to LangSmith.
 
     Returns
     -------
@@ -174,40 +265,68 @@ def evidence_aggregator_node(state: AgentState) -> dict[str, Any]:
     """
     evidences: dict[str, list[Evidence]] = state.get("evidences", {})  # type: ignore[call-overload]
 
-    # ── 1. Completeness check ─────────────────────────────────────────────
-    present = frozenset(evidences.keys())
-    missing = REQUIRED_INTERIM_CRITERIA - present
+    # ── 1. Completeness check + summary statistics ────────────────────────
+    # Common case is "all present": the keys view's ``>=`` probes the dict
+    # once per required id without building a temporary set, so ``missing``
+    # is only materialised when needed.
+    n_present = len(evidences)
+    missing = (
+        frozenset()
+        if evidences.keys() >= REQUIRED_INTERIM_CRITERIA
+        else REQUIRED_INTERIM_CRITERIA.difference(evidences)
+    )
 
+    # ── 2. One log record per fan-in, structured counts in ``extra`` ──────
+    # The completeness warning always fires; the healthy-path summary is
+    # INFO, so the walk over every Evidence is skipped when INFO is off.
     if missing:
+        total, found = _summarize_evidences(evidences)
+        missing_sorted = sorted(missing)
         logger.warning(
-            "[EvidenceAggregator] INCOMPLETE — missing criteria: %s",
-            sorted(missing),
+            "[EvidenceAggregator] INCOMPLETE — missing criteria: %s | "
+            "criteria: %d, total items: %d, found: %d, not_found: %d",
+            missing_sorted,
+            n_present,
+            total,
+            found,
+            total - found,
+            extra={
+                "evidence_summary": {
+                    "criteria": n_present,
+                    "missing": len(missing),
+                    "missing_criteria": missing_sorted,
+                    "total": total,
+                    "found": found,
+                }
+            },
         )
-    else:
+    elif logger.isEnabledFor(logging.INFO):
+        total, found = _summarize_evidences(evidences)
         logger.info(
-            "[EvidenceAggregator] All %d detective criteria present.",
+            "[EvidenceAggregator] All %d detective criteria present | "
+            "criteria: %d, total items: %d, found: %d, not_found: %d",
             len(REQUIRED_INTERIM_CRITERIA),
+            n_present,
+            total,
+            found,
+            total - found,
+            extra={
+                "evidence_summary": {
+                    "criteria": n_present,
+                    "missing": 0,
+                    "total": total,
+                    "found": found,
+                }
+            },
         )
 
-    # ── 2. Summary statistics ─────────────────────────────────────────────
-    total = sum(len(v) for v in evidences.values())
-    found = sum(1 for evs in evidences.values() for e in evs if e.found)
-    logger.info(
-        "[EvidenceAggregator] Evidence summary — "
-        "criteria: %d, total items: %d, found: %d, not_found: %d",
-        len(present),
-        total,
-        found,
-        total - found,
-    )
-
     # ── 3. Secondary cross-reference for report_accuracy ─────────────────
-    xref_update = _cross_reference_report_accuracy(state)
+    xref_update = _cross_reference_report_accuracy(state, evidences)
 
     # ── 4. Semantic consistency cross-reference ───────────────────────────
     # Compare claims in the PDF report against what the code evidence found.
     # Detects contradictions like "PDF says parallel" but code shows linear.
-    consistency_update = _cross_reference_detective_consistency(state)
+    consistency_update = _cross_reference_detective_consistency(evidences)
 
     merged: dict[str, list[Evidence]] = {}
     if xref_update:
@@ -215,7 +334,8 @@ def evidence_aggregator_node(state: AgentState) -> dict[str, Any]:
     if consistency_update:
         for criterion_id, new_evs in consistency_update.items():
             if criterion_id in merged:
-                merged[criterion_id] = merged[criterion_id] + new_evs
+                # Helper-built lists are fresh — extend in place, no N+M copy
+                merged[criterion_id].extend(new_evs)
             else:
                 merged[criterion_id] = new_evs
 
@@ -224,51 +344,60 @@ def evidence_aggregator_node(state: AgentState) -> dict[str, Any]:
 
 def _cross_reference_report_accuracy(
     state: AgentState,
+    evidences: dict[str, list[Evidence]],
 ) -> dict[str, list[Evidence]] | None:
     """Finalise the report_accuracy cross-reference using the repo file catalog.
 
     DocAnalyst extracted path claims during parallel execution but could not
     verify them (the repo file list wasn't available yet).  Now that both
     branches have merged, we use the complete file catalog populated by
-    RepoInvestigator (stored in ``state["repo_files"]``) to cross-reference.
+    RepoInvestigator (pre-normalised in ``state["repo_files_norm"]``) to
+    cross-reference.
 
     Falls back to deriving known paths from Evidence.location strings when
     ``repo_files`` is empty (e.g. if the repo clone failed).
-    """
-    evidences: dict[str, list[Evidence]] = state.get("evidences", {})  # type: ignore[call-overload]
-
-    # ── Primary: use the pre-built repo file catalog ──────────────────────
-    repo_files: list[str] = state.get("repo_files", [])  # type: ignore[call-overload]
 
-    # ── Fallback: derive known paths from Evidence.location strings ───────
-    if not repo_files:
-        for criterion_id in _REPO_CRITERIA:
-            for ev in evidences.get(criterion_id, []):
-                loc = ev.location.replace("\\", "/").split(":")[0].strip()
-                if "/" in loc and not loc.startswith("http") and "." in loc.split("/")[-1]:
-                    repo_files.append(loc)
-        if not repo_files:
-            return None  # Repo clone failed — cannot cross-reference
+    *evidences* is the aggregator's already-extracted ``state["evidences"]``.
+    """
+    doc_evs = evidences.get("report_accuracy", [])
 
-    # Collect the claimed paths DocAnalyst extracted
+    # Collect the claimed paths DocAnalyst extracted — nothing to verify
+    # means no repo catalog work at all.
     claimed_paths: list[str] = []
-    for ev in evidences.get("report_accuracy", []):
+    for ev in doc_evs:
         if ev.content:
-            for line in ev.content.splitlines():
-                line = line.strip()
-                if line.startswith("claimed:"):
-                    claimed_paths.append(line.replace("claimed:", "").strip())
-
+            claimed_paths.extend(_CLAIMED_RE.findall(ev.content))
     if not claimed_paths:
         return None
 
-    # Perform the cross-reference
-    repo_norm = {p.replace("\\", "/").lstrip("./") for p in repo_files}
-    verified: list[str] = []
-    hallucinated: list[str] = []
-    for path in claimed_paths:
-        norm = path.replace("\\", "/").lstrip("./")
-        (verified if norm in repo_norm else hallucinated).append(path)
+    # ── Primary: use the pre-normalised repo file catalog ─────────────────
+    repo_norm: frozenset[str] = state.get("repo_files_norm") or frozenset(  # type: ignore[call-overload]
+        sys.intern(p.translate(_BSLASH_TRANS).lstrip("./"))
+        for p in state.get("repo_files", [])  # type: ignore[call-overload]
+    )
+
+    # ── Fallback: derive known paths from Evidence.location strings ───────
+    if not repo_norm:
+        # Split, test, and normalise each location exactly once
+        repo_norm = frozenset(
+            sys.intern(loc.lstrip("./"))
+            for ev in chain.from_iterable(evidences.get(c, ()) for c in _REPO_CRITERIA)
+            if _is_repo_path(loc := ev.location.translate(_BSLASH_TRANS).split(":", 1)[0].strip())
+        )
+        if not repo_norm:
+            return None  # Repo clone failed — cannot cross-reference
+
+    # Perform the cross-reference — normalise each claim once, then let the
+    # set do the work: a C-level superset test settles the common
+    # "every claim verified" case without building a membership mask.
+    # Claims stay a list (not a set) so duplicates and order are preserved.
+    claimed_norm = [sys.intern(p.translate(_BSLASH_TRANS).lstrip("./")) for p in claimed_paths]
+    if repo_norm.issuperset(claimed_norm):
+        verified, hallucinated = claimed_paths, []
+    else:
+        mask = list(map(repo_norm.__contains__, claimed_norm))
+        verified = list(compress(claimed_paths, mask))
+        hallucinated = list(compress(claimed_paths, [not m for m in mask]))
 
     rate = len(hallucinated) / len(claimed_paths)
     passes = rate == 0.0
@@ -296,12 +425,18 @@ def _cross_reference_report_accuracy(
         criterion_id="report_accuracy",
     )
 
-    existing = list(evidences.get("report_accuracy", []))
-    return {"report_accuracy": existing + [xref_evidence]}
+    # operator.ior replaces the whole per-criterion list, so carry the
+    # DocAnalyst items forward — built in one allocation, no interim copy.
+    return {"report_accuracy": [*doc_evs, xref_evidence]}
+
+
+def _is_repo_path(loc: str) -> bool:
+    """Return True when an Evidence location looks like a repo-relative file path."""
+    return "/" in loc and not loc.startswith("http") and "." in loc.rsplit("/", 1)[-1]
 
 
 def _cross_reference_detective_consistency(
-    state: AgentState,
+    evidences: dict[str, list[Evidence]],
 ) -> dict[str, list[Evidence]] | None:
     """Semantic consistency check: compare PDF claims against code evidence.
 
@@ -317,8 +452,6 @@ def _cross_reference_detective_consistency(
     Returns an additional Evidence item for ``graph_orchestration`` when a
     contradiction or strong confirmation is found.
     """
-    evidences: dict[str, list[Evidence]] = state.get("evidences", {})  # type: ignore[call-overload]
-
     # ── Extract code signals from graph_orchestration evidence ────────────
     graph_evs = evidences.get("graph_orchestration", [])
     code_has_parallel = any(ev.found for ev in graph_evs)
@@ -395,8 +528,7 @@ def _cross_reference_detective_consistency(
         criterion_id="graph_orchestration",
     )
 
-    existing = list(evidences.get("graph_orchestration", []))
-    return {"graph_orchestration": existing + [cross_ev]}
+    return {"graph_orchestration": [*graph_evs, cross_ev]}
 
 
 # ---------------------------------------------------------------------------
@@ -417,6 +549,8 @@ def _route_after_evidence(state: AgentState) -> str | list[str]:
         which LangGraph interprets as a parallel fan-out to all three
         nodes simultaneously.
     """
+    from langgraph.graph import END
+
     evidences: dict[str, list[Evidence]] = state.get("evidences", {})  # type: ignore[call-overload]
 
     has_any_evidence = any(bool(ev_list) for ev_list in evidences.values())
@@ -452,39 +586,45 @@ def judicial_aggregator_node(state: AgentState) -> dict[str, Any]:
     """
     opinions: list[JudicialOpinion] = state.get("opinions", [])  # type: ignore[call-overload]
 
-    # Group by criterion to check judge coverage
-    coverage: dict[str, set[str]] = {}
+    # Group by criterion to check judge coverage — one bit per judge
+    coverage: dict[str, int] = {}
     for op in opinions:
-        coverage.setdefault(op.criterion_id, set()).add(op.judge)
+        coverage[op.criterion_id] = coverage.get(op.criterion_id, 0) | _JUDGE_BIT.get(op.judge, 0)
 
-    fully_covered = sum(
-        1 for judges in coverage.values() if judges >= _EXPECTED_JUDGES
-    )
+    fully_covered = sum(1 for mask in coverage.values() if mask == _ALL_JUDGES_MASK)
     partially_covered = len(coverage) - fully_covered
-    missing_judges_report = {
-        cid: sorted(_EXPECTED_JUDGES - judges)
-        for cid, judges in coverage.items()
-        if judges < _EXPECTED_JUDGES
-    }
 
-    if missing_judges_report:
+    summary = {
+        "opinions": len(opinions),
+        "fully_covered": fully_covered,
+        "partially_covered": partially_covered,
+    }
+    if partially_covered:
+        # Decode missing judges from the masks only if the record is emitted
         logger.warning(
-            "[JudicialAggregator] Incomplete coverage — criteria missing judges: %s",
-            missing_judges_report,
+            "[JudicialAggregator] Judicial phase complete — "
+            "%d total opinions | %d criteria fully covered | %d partially covered | "
+            "criteria missing judges: %s",
+            len(opinions),
+            fully_covered,
+            partially_covered,
+            _Lazy(
+                lambda: {
+                    cid: sorted(j for j, bit in _JUDGE_BIT.items() if not mask & bit)
+                    for cid, mask in coverage.items()
+                    if mask != _ALL_JUDGES_MASK
+                }
+            ),
+            extra={"judicial_summary": summary},
         )
     else:
         logger.info(
-            "[JudicialAggregator] All %d criteria have full 3-judge coverage.",
+            "[JudicialAggregator] Judicial phase complete — "
+            "%d total opinions | all %d criteria have full 3-judge coverage",
+            len(opinions),
             fully_covered,
+            extra={"judicial_summary": summary},
         )
-
-    logger.info(
-        "[JudicialAggregator] Judicial phase complete — "
-        "%d total opinions | %d criteria fully covered | %d partially covered",
-        len(opinions),
-        fully_covered,
-        partially_covered,
-    )
     return {}
 
 
@@ -493,9 +633,14 @@ def judicial_aggregator_node(state: AgentState) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def build_graph() -> Any:
     """Construct and compile the full Automaton Auditor StateGraph.
 
+    Memoised: node registration, edge wiring, and ``.compile()`` run once
+    per process.  Per-run tags and metadata are passed at invoke time, so
+    every audit reuses the same compiled graph.
+
     Graph structure (final submission)
     ------------------------------------
 
@@ -517,6 +662,15 @@ def build_graph() -> Any:
     CompiledStateGraph
         Pre-configured with LangSmith metadata via ``.with_config()``.
     """
+    # Deferred imports: langgraph and the node modules (which pull in the
+    # LangChain / Gemini stack) load only when a graph is actually built.
+    _ensure_env_loaded()
+    from langgraph.graph import END, START, StateGraph
+
+    from src.nodes.detectives import doc_analyst_node, repo_investigator_node, vision_inspector_node
+    from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
+    from src.nodes.justice import chief_justice_node
+
     builder: StateGraph = StateGraph(AgentState)
 
     # ── Register all nodes ────────────────────────────────────────────────
@@ -570,7 +724,11 @@ def build_graph() -> Any:
 # ---------------------------------------------------------------------------
 
 
-def create_initial_state(repo_url: str, pdf_path: str) -> AgentState:
+def create_initial_state(
+    repo_url: str,
+    pdf_path: str,
+    rubric_dimensions: list[dict[str, Any]] | None = None,
+) -> AgentState:
     """Build a fully typed initial ``AgentState`` for an audit run.
 
     Parameters
@@ -579,15 +737,21 @@ def create_initial_state(repo_url: str, pdf_path: str) -> AgentState:
         GitHub repository URL of the submission to audit.
     pdf_path:
         Absolute or relative path to the trainee's architectural PDF report.
+    rubric_dimensions:
+        Pre-loaded rubric dimensions; loaded from rubric.json when omitted.
     """
+    if rubric_dimensions is None:
+        rubric_dimensions = _load_rubric_dimensions()
     return {
         "repo_url": repo_url,
         "pdf_path": pdf_path,
-        "rubric_dimensions": _load_rubric_dimensions(),
+        "rubric_dimensions": rubric_dimensions,
         "evidences": {},   # identity for operator.ior (dict merge)
         "opinions": [],    # identity for operator.add (list concat)
         "repo_files": [],  # populated by repo_investigator_node after clone
+        "repo_files_norm": frozenset(),  # normalised alongside repo_files
         "final_report": None,
+        "final_report_write": None,
     }
 
 
@@ -596,7 +760,7 @@ def create_initial_state(repo_url: str, pdf_path: str) -> AgentState:
 # ---------------------------------------------------------------------------
 
 
-def run_full_audit(
+async def arun_full_audit(
     repo_url: str,
     pdf_path: str,
     langsmith_project: str = "automaton-auditor",
@@ -611,6 +775,10 @@ def run_full_audit(
     4. Synthesis        — ChiefJustice applies deterministic rules
     5. Report           — AuditReport serialised to audit/<repo>_<ts>.md
 
+    The graph is driven through ``ainvoke()`` so each fan-out step runs on a
+    single event loop: sibling branches overlap their network round-trips
+    and the step costs max(latencies) rather than their sum.
+
     Environment
     -----------
     Set ``LANGCHAIN_TRACING_V2=true`` and ``LANGCHAIN_API_KEY`` in ``.env``
@@ -630,11 +798,23 @@ def run_full_audit(
     AgentState
         Final state containing ``state["evidences"]``, ``state["opinions"]``,
         and ``state["final_report"]`` (an ``AuditReport`` or ``None`` on abort).
+        The Markdown report has been written by the time this returns.
+
+    Raises
+    ------
+    OSError
+        If the Markdown report could not be written.
     """
+    _ensure_env_loaded()
     os.environ.setdefault("LANGCHAIN_PROJECT", langsmith_project)
 
-    graph = build_graph()
-    initial_state = create_initial_state(repo_url, pdf_path)
+    # Cold start: overlap the rubric.json read with graph compilation.
+    # Both are memoised, so warm runs return immediately.
+    rubric_dimensions, graph = await asyncio.gather(
+        asyncio.to_thread(_load_rubric_dimensions),
+        asyncio.to_thread(build_graph),
+    )
+    initial_state = create_initial_state(repo_url, pdf_path, rubric_dimensions)
 
     repo_name = repo_url.rstrip("/").rsplit("/", 1)[-1]
     run_config: dict[str, Any] = {
@@ -652,16 +832,21 @@ def run_full_audit(
         repo_url,
         pdf_path,
     )
-    result: AgentState = graph.invoke(initial_state, config=run_config)
+    result: AgentState = await graph.ainvoke(initial_state, config=run_config)
 
     final_report = result.get("final_report")  # type: ignore[call-overload]
     if final_report is not None:
+        # The report file is written off the graph's return path; wait for it
+        # so callers can read it, and so a failed write raises here.
+        report_write = result.get("final_report_write")  # type: ignore[call-overload]
+        report_path = await asyncio.wrap_future(report_write) if report_write else None
         logger.info(
             "[Graph] Audit complete — overall_score=%.2f/5.0 | "
-            "criteria=%d | opinions=%d",
+            "criteria=%d | opinions=%d | report=%s",
             final_report.overall_score,
             len(final_report.criteria),
             len(result.get("opinions", [])),  # type: ignore[call-overload]
+            report_path,
         )
     else:
         logger.warning("[Graph] Audit ended without a final report (graceful abort or error).")
@@ -669,6 +854,19 @@ def run_full_audit(
     return result
 
 
+def run_full_audit(
+    repo_url: str,
+    pdf_path: str,
+    langsmith_project: str = "automaton-auditor",
+) -> AgentState:
+    """Synchronous entry point — runs ``arun_full_audit()`` on a fresh event loop.
+
+    Must not be called from inside a running event loop (e.g. a notebook
+    cell or an async web handler); ``await arun_full_audit(...)`` there instead.
+    """
+    return asyncio.run(arun_full_audit(repo_url, pdf_path, langsmith_project))
+
+
 def run_interim_audit(
     repo_url: str,
     pdf_path: str,
@@ -686,6 +884,15 @@ def run_interim_audit(
     return run_full_audit(repo_url, pdf_path, langsmith_project)
 
 
+def __getattr__(name: str) -> Any:
+    """PEP 562 hook — keep ``END`` / ``START`` importable without an eager langgraph import."""
+    if name in ("END", "START"):
+        import langgraph.graph
+
+        return getattr(langgraph.graph, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -693,6 +900,7 @@ def run_interim_audit(
 __all__: list[str] = [
     "build_graph",
     "create_initial_state",
+    "arun_full_audit",
     "run_full_audit",
     "run_interim_audit",
     "evidence_aggregator_node",
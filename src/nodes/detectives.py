@@ -39,12 +39,20 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
+try:  # optional accelerator for the rubric parse — stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+from src import cache as evidence_cache
 from src.state import AgentState, Evidence
 from src.tools.doc_tools import DocumentAuditor
-from src.tools.repo_tools import CloneError, RepoInvestigator
+from src.tools.repo_tools import RepoCache, RepoInvestigator, remote_head
 from src.tools.vision_tools import VisionInspector
 
 logger = logging.getLogger(__name__)
@@ -56,27 +64,43 @@ logger = logging.getLogger(__name__)
 _RUBRIC_PATH: Path = Path(__file__).parent.parent.parent / "rubric" / "rubric.json"
 
 
-def _load_rubric() -> dict[str, Any]:
+def _load_criteria() -> tuple[frozenset[str], frozenset[str]]:
+    """Return ``(repo_criteria, pdf_criteria)`` ids from rubric.json.
+
+    Only the two frozensets outlive module import; the parsed rubric is
+    dropped.  Ids are interned — JSON-decoded strings are not, and these
+    ids key every evidence dict.
+    """
     try:
-        return json.loads(_RUBRIC_PATH.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        if orjson is not None:
+            data = orjson.loads(_RUBRIC_PATH.read_bytes())
+        else:
+            data = json.loads(_RUBRIC_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:  # orjson.JSONDecodeError subclasses it
         logger.warning("Could not load rubric from %s: %s", _RUBRIC_PATH, exc)
-        return {"dimensions": []}
+        return frozenset(), frozenset()
+    repo: set[str] = set()
+    pdf: set[str] = set()
+    # Both pdf_* artifacts belong to DocAnalyst's absence/failure maps
+    by_artifact = {"github_repo": repo, "pdf_report": pdf, "pdf_images": pdf}
+    dimension: dict[str, Any]
+    for dimension in data.get("dimensions", ()):
+        bucket = by_artifact.get(dimension.get("target_artifact"))
+        if bucket is not None:
+            bucket.add(sys.intern(dimension["id"]))
+    return frozenset(repo), frozenset(pdf)
 
 
-_RUBRIC: dict[str, Any] = _load_rubric()
-
 # Criterion IDs grouped by the detective responsible for them
-_REPO_CRITERIA: frozenset[str] = frozenset(
-    d["id"]
-    for d in _RUBRIC.get("dimensions", [])
-    if d.get("target_artifact") == "github_repo"
-)
-_PDF_CRITERIA: frozenset[str] = frozenset(
-    d["id"]
-    for d in _RUBRIC.get("dimensions", [])
-    if d.get("target_artifact") in ("pdf_report", "pdf_images")
-)
+_REPO_CRITERIA: Final[frozenset[str]]
+_PDF_CRITERIA: Final[frozenset[str]]
+_REPO_CRITERIA, _PDF_CRITERIA = _load_criteria()
+
+#: Backslash → slash translation table for repo path normalisation
+_BSLASH_TRANS: dict[int, str] = str.maketrans("\\", "/")
+
+#: Persistent clone cache shared by every audit in this process
+_CLONE_CACHE: RepoCache = RepoCache()
 
 # ---------------------------------------------------------------------------
 # RepoInvestigatorNode
@@ -88,13 +112,21 @@ def repo_investigator_node(state: AgentState) -> dict[str, Any]:
 
     Wraps ``RepoInvestigator.run_all()`` which:
     * Validates the URL before any syscall.
-    * Clones into a ``tempfile.TemporaryDirectory`` sandbox.
+    * Analyses a ``RepoCache`` checkout — refreshed by shallow fetch when
+      the repo was seen before — or, with the cache disabled, clones into
+      a ``tempfile.TemporaryDirectory`` sandbox.
     * Runs AST-based analysis for every ``github_repo`` rubric criterion.
     * Returns criterion-keyed ``Evidence`` objects.
 
-    On any exception the node degrades gracefully: it returns a single
-    failure ``Evidence`` for ``git_forensic_analysis`` so the graph can
-    continue to the aggregator without crashing.
+    With the evidence cache enabled, when the remote ``HEAD`` resolves and
+    an earlier audit already analysed that exact revision, the cached
+    evidence (``src.cache``) is returned and the clone is skipped.  Fresh
+    evidence is cached under the revision the checkout actually holds.
+
+    On any exception the node degrades gracefully: it returns failure
+    ``Evidence`` for every repo criterion so the graph can continue to the
+    aggregator without crashing.  Clone failures are translated by
+    ``run_all()`` itself, identically with the clone cache on or off.
 
     Returns
     -------
@@ -106,27 +138,63 @@ def repo_investigator_node(state: AgentState) -> dict[str, Any]:
     logger.info("[RepoInvestigator] Starting forensic analysis → %s", repo_url)
 
     try:
-        investigator = RepoInvestigator(repo_url)
-        evidence_map = investigator.run_all()
-        logger.info(
-            "[RepoInvestigator] Completed. Criteria collected: %s | repo_files: %d",
-            sorted(evidence_map.keys()),
-            len(investigator.repo_files),
-        )
-        return {"evidences": evidence_map, "repo_files": investigator.repo_files}
+        # The ls-remote probe only pays off when there is a cache to consult
+        revision = remote_head(repo_url) if evidence_cache.evidence_enabled() else None
+        if revision is not None and (
+            cached := evidence_cache.get(evidence_cache.evidence_key(repo_url, revision))
+        ) is not None:
+            evidence_map, repo_files = cached
+            logger.info(
+                "[RepoInvestigator] Evidence cache hit for %s @ %s — clone skipped",
+                repo_url,
+                revision[:12],
+            )
+        else:
+            investigator = RepoInvestigator(repo_url, cache=_CLONE_CACHE)
+            evidence_map = investigator.run_all()
+            repo_files = investigator.repo_files
+            # Keyed on the commit actually analysed, which differs from the
+            # probed one if a push landed in between.  An empty file list
+            # means run_all() returned its clone-failure map.
+            if investigator.revision and repo_files:
+                evidence_cache.put(
+                    evidence_cache.evidence_key(repo_url, investigator.revision),
+                    evidence_map,
+                    repo_files,
+                )
+
+        if logger.isEnabledFor(logging.INFO):  # skip the sort when INFO is off
+            logger.info(
+                "[RepoInvestigator] Completed. Criteria collected: %s | repo_files: %d",
+                sorted(evidence_map),
+                len(repo_files),
+            )
+        return {
+            "evidences": evidence_map,
+            "repo_files": repo_files,
+            # Interned: the aggregator probes this set with interned claims,
+            # so hits short-circuit on identity before comparing characters
+            "repo_files_norm": frozenset(
+                sys.intern(p.translate(_BSLASH_TRANS).lstrip("./")) for p in repo_files
+            ),
+        }
 
     except ValueError as exc:
         # URL validation failure — not a transient error; no retry
         logger.error("[RepoInvestigator] Invalid repository URL: %s", exc)
-        return {"evidences": _clone_failure_map(str(exc), repo_url), "repo_files": []}
-
-    except CloneError as exc:
-        logger.error("[RepoInvestigator] Clone failed: %s", exc)
-        return {"evidences": _clone_failure_map(str(exc), repo_url), "repo_files": []}
+        return {
+            "evidences": _clone_failure_map(str(exc), repo_url),
+            "repo_files": [],
+            "repo_files_norm": frozenset(),
+        }
 
     except Exception as exc:  # noqa: BLE001 — surface unexpected errors as Evidence
         logger.exception("[RepoInvestigator] Unexpected error during analysis")
-        return {"evidences": _clone_failure_map(str(exc), repo_url), "repo_files": []}
+        return {
+            "evidences": _clone_failure_map(str(exc), repo_url),
+            "repo_files": [],
+            "repo_files_norm": frozenset(),
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -164,10 +232,17 @@ def doc_analyst_node(state: AgentState) -> dict[str, Any]:
         logger.warning("[DocAnalyst] pdf_path is empty — returning absence Evidence")
         return {"evidences": _missing_pdf_map("(not specified)")}
 
-    if not Path(pdf_path).exists():
+    if not os.path.isfile(pdf_path):  # also rejects directories
         logger.warning("[DocAnalyst] PDF not found at '%s'", pdf_path)
         return {"evidences": _missing_pdf_map(pdf_path)}
 
+    # ── Evidence cache: same PDF bytes → same findings ───────────────────
+    cache_key = evidence_cache.document_key(pdf_path, DocumentAuditor.PDF_BACKEND)
+    cached = evidence_cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        logger.info("[DocAnalyst] Evidence cache hit for %s — skipping ingest", pdf_path)
+        return {"evidences": cached[0]}
+
     # ── Ingest PDF via docling (with automatic fallback) ──────────────────
     auditor = DocumentAuditor()
     try:
@@ -182,10 +257,7 @@ def doc_analyst_node(state: AgentState) -> dict[str, Any]:
     logger.info(
         "[DocAnalyst] Theoretical depth evidence: found=%s, substantive_terms=%s",
         theoretical_depth_evidence.found,
-        # Count substantive hits from the content summary
-        theoretical_depth_evidence.content.count("✓ substantive")
-        if theoretical_depth_evidence.content
-        else 0,
+        auditor.substantive_term_count,
     )
 
     # ── Protocol 2: Report accuracy — extraction only ─────────────────────
@@ -198,7 +270,7 @@ def doc_analyst_node(state: AgentState) -> dict[str, Any]:
             "the actual repository structure"
         ),
         found=bool(claimed_paths),
-        content="\n".join(f"  claimed: {p}" for p in claimed_paths) or None,
+        content="\n".join(map("  claimed: {}".format, claimed_paths)) or None,
         location=pdf_path,
         rationale=(
             f"Extracted {len(claimed_paths)} file path(s) from the PDF. "
@@ -212,12 +284,13 @@ def doc_analyst_node(state: AgentState) -> dict[str, Any]:
         "[DocAnalyst] Report accuracy: %d paths extracted", len(claimed_paths)
     )
 
-    return {
-        "evidences": {
-            "theoretical_depth": [theoretical_depth_evidence],
-            "report_accuracy": [report_accuracy_evidence],
-        }
+    evidence_map = {
+        "theoretical_depth": [theoretical_depth_evidence],
+        "report_accuracy": [report_accuracy_evidence],
     }
+    if cache_key:
+        evidence_cache.put(cache_key, evidence_map)
+    return {"evidences": evidence_map}
 
 
 # ---------------------------------------------------------------------------
@@ -306,7 +379,7 @@ def vision_inspector_node(state: AgentState) -> dict[str, Any]:
         pdf_path or "(no PDF provided)",
     )
 
-    if not pdf_path or not Path(pdf_path).exists():
+    if not pdf_path or not os.path.isfile(pdf_path):
         logger.warning("[VisionInspector] PDF not found at '%s'", pdf_path)
         absent_evidence = Evidence(
             goal="Verify architectural diagram accurately shows parallel swarm structure",
@@ -12,7 +12,9 @@ Contract
 Each node:
   1. Reads state["evidences"]         — {criterion_id: [Evidence, ...]}
   2. Reads state["rubric_dimensions"] — list of RubricDimension-shaped dicts
-  3. For each criterion, invokes Gemini via .with_structured_output(JudicialOpinion)
+  3. Invokes Gemini via .with_structured_output() — one JudgePanelVerdict call
+     covering every criterion, falling back to concurrent, staggered
+     per-criterion JudicialOpinion calls for any criterion it misses
   4. Retries up to MAX_RETRIES times on ValidationError or LLM failure
   5. Returns {"opinions": [JudicialOpinion, ...]}
          ↳ operator.add reducer safely concatenates all three judges' lists
@@ -34,17 +36,23 @@ after deserialization in case the model hallucinated either value.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import random
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import ValidationError
 
-from src.state import AgentState, Evidence, JudicialOpinion
+from src import cache as result_cache
+from src.state import AgentState, Evidence, JudgePanelVerdict, JudicialOpinion
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +63,27 @@ logger = logging.getLogger(__name__)
 _JudgeName = Literal["Prosecutor", "Defense", "TechLead"]
 
 MAX_RETRIES: int = 3
-RETRY_DELAY_SECONDS: float = 5.0       # default delay between non-429 retries
+RETRY_BASE_DELAY_SECONDS: float = 2.0  # first non-429 back-off; doubles per attempt
+RETRY_MAX_DELAY_SECONDS: float = 30.0  # cap on the back-off before jitter
 _RATE_LIMIT_BUFFER_SECONDS: float = 8.0  # extra buffer added on top of API retryDelay
 
+# Errors not worth retrying — see _is_permanent
+_PERMANENT_HTTP_CODES: frozenset[int] = frozenset({400, 401, 403, 404})
+_PERMANENT_STATUSES: tuple[str, ...] = (
+    "INVALID_ARGUMENT",
+    "UNAUTHENTICATED",
+    "PERMISSION_DENIED",
+    "NOT_FOUND",
+)
+
+# Evidence content budget in the judge prompt, in estimated tokens.  Each
+# item gets an equal share of the per-criterion budget, capped per item, so a
+# criterion with many large findings cannot blow up the prompt.  Tokens are
+# estimated at ~4 characters each — no tokenizer round-trip per prompt.
+_CHARS_PER_TOKEN: int = 4
+_MAX_EVIDENCE_TOKENS: int = 625     # per item (≈ 2,500 characters)
+_MAX_CRITERION_TOKENS: int = 6000   # across all items of one criterion
+
 # Thundering-herd mitigation for free-tier API quota.
 # Three judges fan-out in parallel; without offsets they all fire simultaneously
 # per criterion, exhausting the per-minute token quota in one burst.
@@ -67,13 +93,36 @@ _JUDGE_STARTUP_OFFSET: dict[str, float] = {
     "Defense":    90.0,   # waits 90 s — lets Prosecutor clear 2-3 criteria first
     "TechLead":   180.0,  # waits 3 min — runs almost entirely after Defense
 }
-_INTER_CRITERION_DELAY_SECONDS: float = 15.0  # pause between criteria within a judge
+_INTER_CRITERION_DELAY_SECONDS: float = 15.0  # stagger between criterion launches within a judge
 
 # Model is configurable via GEMINI_MODEL env var.
 # Default: gemini-2.5-flash (current free-tier model; 2.0/1.5 series deprecated).
 _MODEL: str = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
 _TEMPERATURE: float = 0.2  # Low temperature → consistent, reasoned judgments
 
+# Process-wide cap on in-flight judge LLM calls, shared by all three judges.
+# Sized to the provider's concurrent-request allowance via
+# AUDITOR_MAX_LLM_CONCURRENCY so a fan-out burst queues locally instead of
+# tripping 429s and serialising anyway through retry back-off.
+_MAX_LLM_CONCURRENCY: int = int(os.environ.get("AUDITOR_MAX_LLM_CONCURRENCY", "6"))
+_LLM_SEMAPHORE: threading.BoundedSemaphore = threading.BoundedSemaphore(_MAX_LLM_CONCURRENCY)
+
+# Ask for all of a judge's uncached criteria in one JudgePanelVerdict call
+# (persona prompt and round-trip paid once); any criterion the panel call
+# fails to cover falls back to its own call.  AUDITOR_JUDGE_BATCH=0 disables.
+_BATCH_CRITERIA: bool = os.environ.get("AUDITOR_JUDGE_BATCH", "1") != "0"
+
+# Opt-in (AUDITOR_JUDGE_SHORTCIRCUIT=1): the Prosecutor scores a criterion 1
+# without an LLM call when every detective finding is not-found with
+# negligible confidence — its doctrine ("missing evidence means the feature
+# does not exist") leaves no room for another verdict.  A confident
+# not-found (e.g. a TypedDict without reducers) still deliberates, as do
+# Defense and TechLead.
+_SHORTCIRCUIT_ABSENT: bool = os.environ.get("AUDITOR_JUDGE_SHORTCIRCUIT", "0") == "1"
+
+#: Confidence below which a not-found finding counts as trivially absent
+_ABSENT_CONFIDENCE: float = 0.1
+
 # ---------------------------------------------------------------------------
 # Persona system prompts — deliberately distinct and conflicting
 # ---------------------------------------------------------------------------
@@ -169,18 +218,82 @@ _SYSTEM_PROMPTS: dict[str, str] = {
     "TechLead": _TECHLEAD_SYSTEM,
 }
 
+# Built once and sent as the first message of every call, so each persona's
+# request prefix is byte-identical and eligible for Gemini's implicit caching.
+# (Explicit CachedContent is not used: each prompt is ~400 tokens, below the
+# API's minimum cacheable size.)
+_SYSTEM_MESSAGES: dict[str, SystemMessage] = {
+    persona: SystemMessage(content=prompt) for persona, prompt in _SYSTEM_PROMPTS.items()
+}
+
+_PROMPT_HEADER_TEMPLATE = """\
+Evaluate the rubric criterion below using ONLY the forensic evidence provided with it.
+
+Return your verdict as a JudicialOpinion with these EXACT field values:
+  • judge          → "{persona}"           ← use EXACTLY this string, nothing else
+  • criterion_id   → the CRITERION ID below ← copy it EXACTLY, nothing else
+  • score          → integer 1–5           ← apply your persona's scoring doctrine
+  • argument       → your full reasoning, citing evidence goals and locations
+  • cited_evidence → list of Evidence goal strings or location strings you are citing
+"""
+
+_PANEL_HEADER_TEMPLATE = """\
+Evaluate EACH numbered rubric criterion below using ONLY the forensic evidence provided with it.
+
+Return a JudgePanelVerdict whose "opinions" list holds exactly one JudicialOpinion per
+criterion, in the order the criteria are numbered, with these EXACT field values:
+  • judge          → "{persona}"           ← use EXACTLY this string, nothing else
+  • criterion_id   → that criterion's CRITERION ID ← copy it EXACTLY, nothing else
+  • score          → integer 1–5           ← apply your persona's scoring doctrine
+  • argument       → your full reasoning, citing that criterion's evidence goals and locations
+  • cited_evidence → list of Evidence goal strings or location strings you are citing
+"""
+
+# Static per-persona heads of every user prompt — see _build_user_prompt
+_PROMPT_HEADERS: dict[str, str] = {
+    persona: _PROMPT_HEADER_TEMPLATE.format(persona=persona) for persona in _SYSTEM_PROMPTS
+}
+_PANEL_HEADERS: dict[str, str] = {
+    persona: _PANEL_HEADER_TEMPLATE.format(persona=persona) for persona in _SYSTEM_PROMPTS
+}
+
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _get_llm() -> ChatGoogleGenerativeAI:
-    """Construct the Gemini LLM instance."""
+    """Construct the Gemini client once per process.
+
+    All three judges (and every criterion thread) share it, so its HTTP
+    connection pool stays warm.  Runnables hold no per-call state, so
+    concurrent ``invoke`` is safe.
+    """
     return ChatGoogleGenerativeAI(model=_MODEL, temperature=_TEMPERATURE)
 
 
-def _format_evidence_block(criterion_id: str, evidences: list[Evidence]) -> str:
-    """Format detective evidence into a readable block for the judge prompt."""
+@functools.lru_cache(maxsize=1)
+def _get_structured_llm() -> Any:
+    """Return the shared client bound (once) to the JudicialOpinion schema."""
+    return _get_llm().with_structured_output(JudicialOpinion)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_panel_llm() -> Any:
+    """Return the shared client bound (once) to the JudgePanelVerdict schema."""
+    return _get_llm().with_structured_output(JudgePanelVerdict)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_evidence_block(criterion_id: str, evidences: tuple[Evidence, ...]) -> str:
+    """Format detective evidence into a readable block for the judge prompt.
+
+    Memoised: all three judges format the same (frozen, hashable) Evidence
+    for each criterion, so the block is built once per criterion per audit.
+    """
+    budget_tokens = min(_MAX_EVIDENCE_TOKENS, _MAX_CRITERION_TOKENS // max(1, len(evidences)))
+    max_chars = budget_tokens * _CHARS_PER_TOKEN
     lines = [f"╔═══ DETECTIVE EVIDENCE: {criterion_id.upper()} ═══╗"]
     for i, ev in enumerate(evidences, 1):
         lines.append(f"\n[{i}]  Goal:       {ev.goal}")
@@ -190,23 +303,23 @@ def _format_evidence_block(criterion_id: str, evidences: list[Evidence]) -> str:
         lines.append(f"     Rationale:  {ev.rationale}")
         if ev.content:
             # Truncate long content to stay within token budget
-            content = ev.content[:2500] + "\n…(truncated)" if len(ev.content) > 2500 else ev.content
+            content = ev.content
+            if len(content) > max_chars:
+                dropped = (len(content) - max_chars) // _CHARS_PER_TOKEN
+                content = f"{content[:max_chars]}\n…(truncated ~{dropped} tokens)"
             lines.append(f"     Content:\n{content}")
     lines.append("╚══════════════════════════════════════╝")
     return "\n".join(lines)
 
 
-def _build_user_prompt(
-    persona: str,
+def _build_criterion_section(
     criterion_id: str,
     evidences: list[Evidence],
     rubric_dim: dict[str, Any],
 ) -> str:
-    """Build the per-criterion evaluation prompt for one judge."""
-    evidence_block = _format_evidence_block(criterion_id, evidences)
+    """Build the criterion, pass/fail patterns and evidence part of a prompt."""
+    evidence_block = _format_evidence_block(criterion_id, tuple(evidences))
     return f"""\
-Evaluate the following rubric criterion using ONLY the forensic evidence provided below.
-
 CRITERION ID  : {criterion_id}
 CRITERION NAME: {rubric_dim.get("name", criterion_id)}
 
@@ -217,16 +330,28 @@ FAILURE PATTERN (Score 1–2 territory):
 {rubric_dim.get("failure_pattern", "N/A")}
 
 {evidence_block}
-
-Return your verdict as a JudicialOpinion with these EXACT field values:
-  • judge          → "{persona}"           ← use EXACTLY this string, nothing else
-  • criterion_id   → "{criterion_id}"      ← use EXACTLY this string, nothing else
-  • score          → integer 1–5           ← apply your persona's scoring doctrine
-  • argument       → your full reasoning, citing evidence goals and locations above
-  • cited_evidence → list of Evidence goal strings or location strings you are citing
 """
 
 
+def _build_user_prompt(persona: str, section: str) -> str:
+    """Build the single-criterion evaluation prompt for one judge.
+
+    The instructions come first and depend only on *persona*, so every call
+    a judge makes shares one prompt prefix (Gemini's implicit cache matches
+    on prefixes); the criterion *section* follows.
+    """
+    return f"{_PROMPT_HEADERS[persona]}\n{section}"
+
+
+def _build_panel_prompt(persona: str, sections: list[str]) -> str:
+    """Build one prompt asking *persona* to rule on every criterion *section*."""
+    numbered = [
+        f"══════ CRITERION {i} of {len(sections)} ══════\n{section}"
+        for i, section in enumerate(sections, 1)
+    ]
+    return f"{_PANEL_HEADERS[persona]}\n" + "\n".join(numbered)
+
+
 def _extract_retry_delay(exc: Exception) -> float:
     """Parse the recommended retry delay (seconds) from a 429 error message.
 
@@ -240,118 +365,253 @@ def _extract_retry_delay(exc: Exception) -> float:
     return 60.0
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Return the jittered exponential back-off (seconds) after failed *attempt*.
+
+    Jitter spreads the retries of concurrent criteria and judges that failed
+    together, so they do not hit the API again in lock-step.
+    """
+    ceiling = min(RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1), RETRY_MAX_DELAY_SECONDS)
+    return ceiling * (0.5 + random.random())
+
+
+def _is_permanent(exc: Exception) -> bool:
+    """Return True for errors that would fail identically on every retry.
+
+    Bad requests (including context overflow), authentication, permission
+    and unknown-model errors.  The HTTP status is read from the ``code`` of
+    the exception or of the API error it wraps (LangChain re-raises
+    google-genai errors ``from`` the original); when none carries one, the
+    gRPC status name in the message is used.
+    """
+    err: BaseException | None = exc
+    while err is not None:
+        code = getattr(err, "code", None)
+        if isinstance(code, int):
+            return code in _PERMANENT_HTTP_CODES
+        err = err.__cause__
+    msg = str(exc)
+    return any(status in msg for status in _PERMANENT_STATUSES)
+
+
 def _is_rate_limited(exc: Exception) -> bool:
     """Return True when the exception is a 429 / RESOURCE_EXHAUSTED response."""
     msg = str(exc)
     return "429" in msg or "RESOURCE_EXHAUSTED" in msg
 
 
-def _run_one_criterion(
+def _invoke_with_retry(
     persona: str,
-    criterion_id: str,
-    evidences: list[Evidence],
-    rubric_dim: dict[str, Any],
-    structured_llm: Any,
-) -> JudicialOpinion | None:
-    """Invoke the judge LLM for a single criterion with retry logic.
+    subject: str,
+    runnable: Any,
+    user_msg: HumanMessage,
+) -> Any | None:
+    """Invoke *runnable* on the persona's system prompt plus *user_msg*, with retries.
 
     On 429 RESOURCE_EXHAUSTED the API embeds a ``retryDelay`` value; we parse
     it and sleep for exactly that long (+ buffer) before retrying rather than
-    using the short fixed delay that guarantees re-failure.
+    using the short fixed delay that guarantees re-failure.  *subject* names
+    the request in log lines (e.g. ``criterion=git_forensic_analysis``).
 
     Returns
     -------
-    JudicialOpinion | None
-        None if all MAX_RETRIES attempts fail.
+    Any | None
+        The structured result, or None if all MAX_RETRIES attempts fail.
     """
-    system_msg = SystemMessage(content=_SYSTEM_PROMPTS[persona])
-    user_msg = HumanMessage(
-        content=_build_user_prompt(persona, criterion_id, evidences, rubric_dim)
-    )
+    system_msg = _SYSTEM_MESSAGES[persona]
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            opinion: JudicialOpinion = structured_llm.invoke([system_msg, user_msg])
-
-            # Defensive correction: re-apply correct judge/criterion_id in case
-            # the model hallucinated either field despite the schema constraint.
-            if opinion.judge != persona or opinion.criterion_id != criterion_id:
-                logger.debug(
-                    "[%s] Correcting hallucinated judge/criterion on attempt %d",
-                    persona,
-                    attempt,
-                )
-                opinion = JudicialOpinion(
-                    judge=persona,  # type: ignore[arg-type]
-                    criterion_id=criterion_id,
-                    score=max(1, min(5, opinion.score)),
-                    argument=opinion.argument,
-                    cited_evidence=opinion.cited_evidence,
-                )
-
-            logger.debug(
-                "[%s] criterion=%s → score=%d (attempt %d/%d)",
-                persona,
-                criterion_id,
-                opinion.score,
-                attempt,
-                MAX_RETRIES,
-            )
-            return opinion
+            with _LLM_SEMAPHORE:
+                return runnable.invoke([system_msg, user_msg])
 
         except ValidationError as exc:
             logger.warning(
-                "[%s] ValidationError on criterion=%s (attempt %d/%d): %s",
+                "[%s] ValidationError on %s (attempt %d/%d): %s",
                 persona,
-                criterion_id,
+                subject,
                 attempt,
                 MAX_RETRIES,
                 exc,
             )
             if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY_SECONDS)
+                time.sleep(_backoff_delay(attempt))
 
         except Exception as exc:  # noqa: BLE001
             if _is_rate_limited(exc):
                 delay = _extract_retry_delay(exc)
                 logger.warning(
-                    "[%s] Rate-limited on criterion=%s (attempt %d/%d) — "
+                    "[%s] Rate-limited on %s (attempt %d/%d) — "
                     "sleeping %.0fs as instructed by API",
                     persona,
-                    criterion_id,
+                    subject,
                     attempt,
                     MAX_RETRIES,
                     delay,
                 )
                 if attempt < MAX_RETRIES:
                     time.sleep(delay)
+            elif _is_permanent(exc):
+                logger.error(
+                    "[%s] Permanent LLM error on %s — not retrying: %s",
+                    persona,
+                    subject,
+                    exc,
+                )
+                return None
             else:
                 logger.warning(
-                    "[%s] LLM error on criterion=%s (attempt %d/%d): %s",
+                    "[%s] LLM error on %s (attempt %d/%d): %s",
                     persona,
-                    criterion_id,
+                    subject,
                     attempt,
                     MAX_RETRIES,
                     exc,
                 )
                 if attempt < MAX_RETRIES:
-                    time.sleep(RETRY_DELAY_SECONDS)
+                    time.sleep(_backoff_delay(attempt))
 
     logger.error(
-        "[%s] All %d retries exhausted for criterion=%s — opinion omitted",
+        "[%s] All %d retries exhausted for %s — no result",
         persona,
         MAX_RETRIES,
-        criterion_id,
+        subject,
     )
     return None
 
 
+def _correct_opinion(
+    persona: str, criterion_id: str, opinion: JudicialOpinion
+) -> JudicialOpinion:
+    """Re-apply the correct judge/criterion_id in case the model hallucinated either."""
+    if opinion.judge == persona and opinion.criterion_id == criterion_id:
+        return opinion
+    logger.debug(
+        "[%s] Correcting hallucinated judge/criterion for criterion=%s",
+        persona,
+        criterion_id,
+    )
+    # model_copy skips re-validation: score/argument/citations were already
+    # validated, and the id is interned here as the field validator would.
+    return opinion.model_copy(
+        update={"judge": persona, "criterion_id": sys.intern(criterion_id)}
+    )
+
+
+def _absent_opinion(
+    persona: str, criterion_id: str, evidences: list[Evidence]
+) -> JudicialOpinion:
+    """Return the deterministic score-1 opinion for a trivially absent criterion."""
+    return JudicialOpinion(
+        judge=persona,  # type: ignore[arg-type]
+        criterion_id=criterion_id,
+        score=1,
+        argument=(
+            f"All {len(evidences)} detective finding(s) for this criterion report "
+            "the artifact as not found with negligible confidence. Missing evidence means the feature does "
+            "not exist; no implementation can be credited."
+        ),
+        cited_evidence=[ev.goal for ev in evidences],
+    )
+
+
+def _run_one_criterion(
+    persona: str,
+    criterion_id: str,
+    section: str,
+    cache_key: str,
+) -> JudicialOpinion | None:
+    """Invoke the judge LLM for a single criterion with retry logic.
+
+    A successful opinion is stored under *cache_key* (see ``src.cache``);
+    ``_run_judge`` looks it up before scheduling the call.
+
+    Returns
+    -------
+    JudicialOpinion | None
+        None if all MAX_RETRIES attempts fail.
+    """
+    user_msg = HumanMessage(content=_build_user_prompt(persona, section))
+    opinion: JudicialOpinion | None = _invoke_with_retry(
+        persona, f"criterion={criterion_id}", _get_structured_llm(), user_msg
+    )
+    if opinion is None:
+        return None
+
+    opinion = _correct_opinion(persona, criterion_id, opinion)
+    logger.debug("[%s] criterion=%s → score=%d", persona, criterion_id, opinion.score)
+    result_cache.put_opinion(cache_key, opinion)
+    return opinion
+
+
+def _run_panel(
+    persona: str,
+    criterion_ids: list[str],
+    panel_prompt: str,
+) -> list[JudicialOpinion | None]:
+    """Ask for opinions on all *criterion_ids* in one JudgePanelVerdict call.
+
+    *panel_prompt* is the ``_build_panel_prompt`` text for those criteria.
+
+    Opinions are matched to criteria by ``criterion_id`` when the model
+    returns each requested id exactly once, in any order.  Only when none of
+    the returned ids is usable (hallucinated ids, one opinion per criterion)
+    are they matched by position.  Otherwise each id returned exactly once is
+    kept, and criteria left without an opinion — missing or duplicated ids —
+    come back as None for the caller to retry singly.
+    """
+    user_msg = HumanMessage(content=panel_prompt)
+    verdict: JudgePanelVerdict | None = _invoke_with_retry(
+        persona, f"panel of {len(criterion_ids)} criteria", _get_panel_llm(), user_msg
+    )
+    if verdict is None:
+        return [None] * len(criterion_ids)
+
+    returned_ids = [opinion.criterion_id for opinion in verdict.opinions]
+    if sorted(returned_ids) == sorted(criterion_ids):
+        by_id = dict(zip(returned_ids, verdict.opinions, strict=True))
+        return [
+            _correct_opinion(persona, criterion_id, by_id[criterion_id])
+            for criterion_id in criterion_ids
+        ]
+    if len(returned_ids) == len(criterion_ids) and set(returned_ids).isdisjoint(criterion_ids):
+        logger.warning(
+            "[%s] Panel returned unknown criterion ids %s — matching by position",
+            persona,
+            returned_ids,
+        )
+        return [
+            _correct_opinion(persona, criterion_id, opinion)
+            for criterion_id, opinion in zip(criterion_ids, verdict.opinions, strict=True)
+        ]
+
+    logger.warning(
+        "[%s] Panel returned ids %s for criteria %s — keeping unambiguous matches",
+        persona,
+        returned_ids,
+        criterion_ids,
+    )
+    by_id = {
+        opinion.criterion_id: opinion
+        for opinion in verdict.opinions
+        if returned_ids.count(opinion.criterion_id) == 1
+    }
+    return [
+        _correct_opinion(persona, criterion_id, by_id[criterion_id])
+        if criterion_id in by_id
+        else None
+        for criterion_id in criterion_ids
+    ]
+
+
 def _run_judge(persona: str, state: AgentState) -> dict[str, Any]:
     """Core logic shared by all three judge nodes.
 
-    Iterates over every criterion in state["evidences"], calls the LLM
-    with .with_structured_output(JudicialOpinion) for each one, and
-    returns the accumulated opinions list for operator.add reduction.
+    Serves each criterion in state["evidences"] from the opinion cache when
+    possible, asks for the rest in one batched JudgePanelVerdict call,
+    dispatches whatever that misses concurrently as single-criterion
+    JudicialOpinion calls, and returns the accumulated opinions (in
+    criterion order) for operator.add reduction.
 
     Parameters
     ----------
@@ -379,19 +639,10 @@ def _run_judge(persona: str, state: AgentState) -> dict[str, Any]:
     # Build criterion_id → rubric dim lookup for fast access
     rubric_lookup: dict[str, dict[str, Any]] = {d["id"]: d for d in rubric_dims}
 
-    llm = _get_llm()
-    structured_llm = llm.with_structured_output(JudicialOpinion)
-
-    opinions: list[JudicialOpinion] = []
-
-    # Thundering-herd mitigation: stagger judge startup so all three don't
-    # hit the API simultaneously on the first criterion.
-    startup_offset = _JUDGE_STARTUP_OFFSET.get(persona, 0.0)
-    if startup_offset > 0:
-        logger.debug("[%s] Startup offset %.0fs — waiting before first criterion", persona, startup_offset)
-        time.sleep(startup_offset)
-
-    first_criterion = True
+    # Resolve cached opinions first: a fully cached judge makes no LLM call
+    # and skips the startup offset and launch pacing entirely.
+    slots: list[JudicialOpinion | None] = []
+    pending: list[tuple[int, str, str, str]] = []
     for criterion_id, ev_list in evidences.items():
         if not ev_list:
             logger.warning(
@@ -400,30 +651,98 @@ def _run_judge(persona: str, state: AgentState) -> dict[str, Any]:
                 criterion_id,
             )
             continue
-
-        # Inter-criterion delay after the first one to pace API usage
-        if not first_criterion:
-            logger.debug("[%s] Inter-criterion delay %.0fs", persona, _INTER_CRITERION_DELAY_SECONDS)
-            time.sleep(_INTER_CRITERION_DELAY_SECONDS)
-        first_criterion = False
-
+        if _SHORTCIRCUIT_ABSENT and persona == "Prosecutor" and all(
+            not ev.found and ev.confidence < _ABSENT_CONFIDENCE for ev in ev_list
+        ):
+            logger.debug("[%s] criterion=%s → score=1 (all evidence absent)", persona, criterion_id)
+            slots.append(_absent_opinion(persona, criterion_id, ev_list))
+            continue
         rubric_dim = rubric_lookup.get(
             criterion_id,
             {"name": criterion_id, "success_pattern": "", "failure_pattern": ""},
         )
-
-        opinion = _run_one_criterion(
-            persona, criterion_id, ev_list, rubric_dim, structured_llm
+        section = _build_criterion_section(criterion_id, ev_list, rubric_dim)
+        cache_key = result_cache.opinion_key(
+            _MODEL, _TEMPERATURE, _SYSTEM_PROMPTS[persona], _build_user_prompt(persona, section)
         )
-        if opinion is not None:
-            opinions.append(opinion)
+        cached = result_cache.get_opinion(cache_key)
+        if cached is None:
+            pending.append((len(slots), criterion_id, section, cache_key))
+        else:
+            logger.debug("[%s] criterion=%s → score=%d (cached)", persona, criterion_id, cached.score)
+        slots.append(cached)
+
+    panel_prompt = ""
+    panel_keys: list[str] = []
+    if _BATCH_CRITERIA and len(pending) > 1:
+        # A batched answer is cached under the panel prompt it was given —
+        # never under the single-criterion key, which promises an opinion for
+        # exactly that single-criterion prompt.
+        panel_prompt = _build_panel_prompt(persona, [section for _, _, section, _ in pending])
+        panel_keys = [
+            result_cache.opinion_key(
+                _MODEL, _TEMPERATURE, _SYSTEM_PROMPTS[persona], panel_prompt, criterion_id
+            )
+            for _, criterion_id, _, _ in pending
+        ]
+        panel_cached = [result_cache.get_opinion(key) for key in panel_keys]
+        if all(opinion is not None for opinion in panel_cached):
+            logger.debug("[%s] %d criteria → panel verdict (cached)", persona, len(pending))
+            for (slot, _, _, _), opinion in zip(pending, panel_cached, strict=True):
+                slots[slot] = opinion
+            pending = []
+
+    if pending:
+        # Thundering-herd mitigation: stagger judge startup so all three don't
+        # hit the API simultaneously on the first criterion.
+        startup_offset = _JUDGE_STARTUP_OFFSET.get(persona, 0.0)
+        if startup_offset > 0:
+            logger.debug("[%s] Startup offset %.0fs — waiting before first criterion", persona, startup_offset)
+            time.sleep(startup_offset)
+
+        if panel_prompt:
+            panel = _run_panel(
+                persona, [criterion_id for _, criterion_id, _, _ in pending], panel_prompt
+            )
+            for (slot, _, _, _), panel_key, opinion in zip(
+                pending, panel_keys, panel, strict=True
+            ):
+                if opinion is not None:
+                    slots[slot] = opinion
+                    result_cache.put_opinion(panel_key, opinion)
+            pending = [item for item, opinion in zip(pending, panel, strict=True) if opinion is None]
+            if pending:
+                logger.info(
+                    "[%s] Panel call left %d criteria unanswered — judging them singly",
+                    persona,
+                    len(pending),
+                )
 
-    logger.info(
-        "[%s] Complete — %d opinions rendered for criteria: %s",
-        persona,
-        len(opinions),
-        sorted(op.criterion_id for op in opinions),
-    )
+    if pending:
+        def _judge_criterion(launch: int) -> None:
+            # Launches stay paced one per _INTER_CRITERION_DELAY_SECONDS as before,
+            # but a slow response no longer holds back the criteria behind it.
+            if launch:
+                time.sleep(launch * _INTER_CRITERION_DELAY_SECONDS)
+            slot, criterion_id, section, cache_key = pending[launch]
+            slots[slot] = _run_one_criterion(persona, criterion_id, section, cache_key)
+
+        # Threads mostly sleep or wait on the network; _LLM_SEMAPHORE still
+        # bounds how many calls are in flight across all three judges.
+        with ThreadPoolExecutor(
+            max_workers=len(pending), thread_name_prefix=f"judge-{persona}"
+        ) as pool:
+            list(pool.map(_judge_criterion, range(len(pending))))
+
+    opinions = [op for op in slots if op is not None]
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[%s] Complete — %d opinions rendered for criteria: %s",
+            persona,
+            len(opinions),
+            sorted(op.criterion_id for op in opinions),
+        )
     return {"opinions": opinions}
 
 
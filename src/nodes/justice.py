@@ -39,18 +39,26 @@ Applied in strict priority order:
 Output
 ------
   • Writes a structured Markdown report to audit/<repo_name>_<timestamp>.md
-  • Returns {"final_report": AuditReport} into AgentState.final_report
+  • Returns {"final_report": AuditReport} into AgentState.final_report, and
+    the pending report write as AgentState.final_report_write
 """
 
 from __future__ import annotations
 
 import datetime
+import io
 import logging
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.state import AgentState, AuditReport, CriterionResult, Evidence, JudicialOpinion
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -60,6 +68,14 @@ logger = logging.getLogger(__name__)
 #: Directory where audit Markdown reports are written.
 _AUDIT_DIR: Path = Path(__file__).parent.parent.parent / "audit"
 
+#: UTC tzinfo for report timestamps.
+_UTC: datetime.timezone = datetime.timezone.utc
+
+#: Background writer for audit reports so the graph's return path never waits
+#: on disk I/O.  Each write's Future travels in AgentState.final_report_write;
+#: arun_full_audit() waits on it before returning.
+_IO_POOL: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audit-io")
+
 #: Security-related keywords that confirm a Prosecutor security charge.
 _SECURITY_KEYWORDS: frozenset[str] = frozenset(
     {
@@ -77,9 +93,18 @@ _SECURITY_KEYWORDS: frozenset[str] = frozenset(
 #: Criteria where the Tech Lead carries 50% weight (functionality_weight rule).
 _FUNCTIONALITY_WEIGHTED_CRITERIA: frozenset[str] = frozenset({"graph_orchestration"})
 
+#: C-level accessor for ``Evidence.found`` used in the fact_supremacy scan
+_EV_FOUND: Callable[[Evidence], bool] = attrgetter("found")
+
+#: Sort key for CriterionResult lists — lowest final score first
+_SCORE_KEY: Callable[[CriterionResult], int] = attrgetter("final_score")
+
 #: Score variance threshold that triggers dissent + re-evaluation.
 _VARIANCE_THRESHOLD: int = 2
 
+#: Score bar source — ``_SCORE_BAR[5 - s : 10 - s]`` is s filled + (5 - s) empty.
+_SCORE_BAR: str = "█████░░░░░"
+
 # ---------------------------------------------------------------------------
 # Rule detectors
 # ---------------------------------------------------------------------------
@@ -120,7 +145,7 @@ def _is_defense_overruled(
     """
     if not evidences:
         return False
-    all_absent = all(not ev.found for ev in evidences)
+    all_absent = not any(map(_EV_FOUND, evidences))
     defense_inflated = (
         defense.score > prosecutor.score + 1 and defense.score > tech_lead.score + 1
     )
@@ -132,22 +157,37 @@ def _is_defense_overruled(
 # ---------------------------------------------------------------------------
 
 
+def _round_half_even(numerator: int, denominator: int) -> int:
+    """Round ``numerator / denominator`` to the nearest int, ties to even.
+
+    Integer equivalent of ``round()`` on the weighted float — it reproduces
+    the float path's result for every judge-score combination.  Weights sum
+    to 1 and judge scores lie in 1..5, so the result needs no clamping.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
 def _synthesize_score(
     criterion_id: str,
     prosecutor: JudicialOpinion,
     defense: JudicialOpinion,
     tech_lead: JudicialOpinion,
     evidences: list[Evidence],
+    variance: int,
 ) -> tuple[int, list[str]]:
     """Apply all synthesis rules in priority order.
 
+    *variance* is the max − min spread of the three judges' scores, which
+    the caller has already computed for the dissent rule.
+
     Returns
     -------
     tuple[int, list[str]]
         (final_score, list_of_applied_rule_descriptions)
     """
-    scores = [prosecutor.score, defense.score, tech_lead.score]
-    variance = max(scores) - min(scores)
     applied: list[str] = []
 
     # ── Rule 1: Security Override (highest priority) ───────────────────────
@@ -188,17 +228,13 @@ def _synthesize_score(
 
     # ── Rule 3: Functionality Weight (graph_orchestration only) ───────────
     if criterion_id in _FUNCTIONALITY_WEIGHTED_CRITERIA and tech_lead.score >= 4:
-        # TechLead 50%, Prosecutor 25%, Defense 25%
-        weighted = (
-            tech_lead.score * 0.50
-            + prosecutor.score * 0.25
-            + defense.score * 0.25
-        )
-        final = max(1, min(5, round(weighted)))
+        # TechLead 50%, Prosecutor 25%, Defense 25% — in quarters
+        weighted_q = 2 * tech_lead.score + prosecutor.score + defense.score
+        final = _round_half_even(weighted_q, 4)
         applied.append(
             f"functionality_weight: TechLead confirmed sound architecture "
             f"(score={tech_lead.score}). TechLead weight raised to 50%%. "
-            f"Weighted={weighted:.2f} → {final}."
+            f"Weighted={weighted_q / 4:.2f} → {final}."
         )
         logger.info(
             "[ChiefJustice] functionality_weight → criterion=%s final_score=%d",
@@ -227,19 +263,15 @@ def _synthesize_score(
         return final, applied
 
     # ── Rule 5: Default Weighted Average ─────────────────────────────────
-    # TechLead 40%, Prosecutor 30%, Defense 30%
-    weighted = (
-        tech_lead.score * 0.40
-        + prosecutor.score * 0.30
-        + defense.score * 0.30
-    )
-    final = max(1, min(5, round(weighted)))
+    # TechLead 40%, Prosecutor 30%, Defense 30% — in tenths
+    weighted_t = 4 * tech_lead.score + 3 * prosecutor.score + 3 * defense.score
+    final = _round_half_even(weighted_t, 10)
     applied.append(
         f"default_weighted_average: "
         f"TechLead(40%%)={tech_lead.score} + "
         f"Prosecutor(30%%)={prosecutor.score} + "
         f"Defense(30%%)={defense.score} "
-        f"= {weighted:.2f} → {final}."
+        f"= {weighted_t / 10:.2f} → {final}."
     )
     return final, applied
 
@@ -249,6 +281,21 @@ def _synthesize_score(
 # ---------------------------------------------------------------------------
 
 
+def _excerpt(text: str, limit: int, *, cell: bool = False) -> str:
+    """Return the first *limit* chars of *text* on one line, right-stripped.
+
+    Each ``replace`` runs only when its character is present — judge
+    arguments are usually single-line and pipe-free.  With *cell* set,
+    ``|`` is escaped so the excerpt is safe inside a Markdown table cell.
+    """
+    snippet = text[:limit]
+    if cell and "|" in snippet:
+        snippet = snippet.replace("|", "\\|")
+    if "\n" in snippet:
+        snippet = snippet.replace("\n", " ")
+    return snippet.rstrip()
+
+
 def _build_dissent_summary(
     criterion_id: str,
     prosecutor: JudicialOpinion,
@@ -257,9 +304,9 @@ def _build_dissent_summary(
     applied_rules: list[str],
 ) -> str:
     """Build the mandatory dissent summary for high-variance criteria."""
-    p_excerpt = prosecutor.argument[:280].replace("\n", " ").rstrip()
-    d_excerpt = defense.argument[:280].replace("\n", " ").rstrip()
-    tl_excerpt = tech_lead.argument[:280].replace("\n", " ").rstrip()
+    p_excerpt = _excerpt(prosecutor.argument, 280)
+    d_excerpt = _excerpt(defense.argument, 280)
+    tl_excerpt = _excerpt(tech_lead.argument, 280)
 
     return (
         f"**Prosecutor (Score {prosecutor.score}):** {p_excerpt}…\n\n"
@@ -279,14 +326,14 @@ def _build_remediation(
     label = criterion_id.upper().replace("_", " ")
 
     if final_score >= 4:
-        p_excerpt = prosecutor.argument[:180].replace("\n", " ").rstrip()
+        p_excerpt = _excerpt(prosecutor.argument, 180)
         return (
             f"[{label}] Score {final_score}/5 — No critical remediation required. "
             f"Minor: {p_excerpt}…"
         )
 
-    p_excerpt = prosecutor.argument[:350].replace("\n", " ").rstrip()
-    tl_excerpt = tech_lead.argument[:350].replace("\n", " ").rstrip()
+    p_excerpt = _excerpt(prosecutor.argument, 350)
+    tl_excerpt = _excerpt(tech_lead.argument, 350)
     return (
         f"[{label}] Score {final_score}/5\n"
         f"  Prosecutor charge: {p_excerpt}…\n"
@@ -301,9 +348,14 @@ def _build_executive_summary(
 ) -> str:
     """Build the high-level verdict paragraph for the AuditReport."""
     total = len(results)
-    passing = sum(1 for c in results if c.final_score >= 4)
-    failing = sum(1 for c in results if c.final_score <= 2)
-    dissent_count = sum(1 for c in results if c.dissent_summary is not None)
+    passing = failing = dissent_count = 0
+    for c in results:
+        if c.final_score >= 4:
+            passing += 1
+        elif c.final_score <= 2:
+            failing += 1
+        if c.dissent_summary is not None:
+            dissent_count += 1
 
     if overall_score >= 4.5:
         verdict = "EXEMPLARY"
@@ -329,10 +381,19 @@ def _build_executive_summary(
 
 def _build_remediation_plan(results: list[CriterionResult]) -> str:
     """Build the prioritised remediation plan sorted by score (critical first)."""
-    sorted_results = sorted(results, key=lambda c: c.final_score)
-    critical = [c for c in sorted_results if c.final_score <= 2]
-    needs_work = [c for c in sorted_results if c.final_score == 3]
-    passing = [c for c in sorted_results if c.final_score >= 4]
+    critical: list[CriterionResult] = []
+    needs_work: list[CriterionResult] = []
+    passing: list[CriterionResult] = []
+    for c in results:
+        if c.final_score <= 2:
+            critical.append(c)
+        elif c.final_score == 3:
+            needs_work.append(c)
+        else:
+            passing.append(c)
+    # Only the mixed-score bands need ordering (stable, so ties keep input order)
+    critical.sort(key=_SCORE_KEY)
+    passing.sort(key=_SCORE_KEY)
 
     sections: list[str] = []
 
@@ -362,82 +423,98 @@ def _build_remediation_plan(results: list[CriterionResult]) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _serialize_to_markdown(report: AuditReport) -> Path:
-    """Write the AuditReport to a structured Markdown file under audit/.
+def _serialize_to_markdown(report: AuditReport) -> Future[Path]:
+    """Render the AuditReport to Markdown and schedule the write under audit/.
 
     File naming: audit/<repo_name>_<YYYYMMDDTHHmmss>UTC.md
 
+    The file itself is written on the ``_IO_POOL`` background thread; this
+    function returns as soon as the text is rendered.
+
     Returns
     -------
-    Path
-        Absolute path to the written file.
+    Future[Path]
+        Resolves to the absolute report path once the file is written, or
+        raises the ``OSError`` that stopped the write.
     """
-    _AUDIT_DIR.mkdir(parents=True, exist_ok=True)
-
     repo_name = report.repo_url.rstrip("/").rsplit("/", 1)[-1]
-    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SUTC")
+    timestamp = datetime.datetime.now(_UTC).strftime("%Y%m%dT%H%M%SUTC")
     output_path = _AUDIT_DIR / f"{repo_name}_{timestamp}.md"
 
-    lines: list[str] = [
-        "# Automaton Auditor — Final Audit Report",
-        "",
-        f"**Repository:** {report.repo_url}",
-        f"**Overall Score:** {report.overall_score:.2f} / 5.0",
-        f"**Generated:** {timestamp}",
-        "",
-        "---",
-        "",
-        "## Executive Summary",
-        "",
-        report.executive_summary,
-        "",
-        "---",
-        "",
-        "## Criterion Breakdown",
-        "",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        "# Automaton Auditor — Final Audit Report\n"
+        "\n"
+        f"**Repository:** {report.repo_url}\n"
+        f"**Overall Score:** {report.overall_score:.2f} / 5.0\n"
+        f"**Generated:** {timestamp}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## Executive Summary\n"
+        "\n"
+        f"{report.executive_summary}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## Criterion Breakdown\n"
+        "\n"
+    )
 
     for cr in report.criteria:
-        score_bar = "█" * cr.final_score + "░" * (5 - cr.final_score)
-        lines += [
-            f"### {cr.dimension_name}",
-            "",
-            f"**Final Score: {cr.final_score}/5** `[{score_bar}]`",
-            "",
-            "| Judge | Score | Argument (excerpt) |",
-            "|---|:---:|---|",
-        ]
-        for op in cr.judge_opinions:
-            excerpt = op.argument[:130].replace("|", "\\|").replace("\n", " ").rstrip()
-            lines.append(f"| **{op.judge}** | {op.score} | {excerpt}… |")
-
-        lines.append("")
-
-        if cr.dissent_summary:
-            lines += [
-                "<details>",
-                "<summary>⚖️ Dissent Summary (score variance &gt; 2)</summary>",
-                "",
-                cr.dissent_summary,
-                "",
-                "</details>",
-                "",
-            ]
+        score_bar = _SCORE_BAR[5 - cr.final_score : 10 - cr.final_score]
+        rows = "".join([
+            f"| **{op.judge}** | {op.score} | {_excerpt(op.argument, 130, cell=True)}… |\n"
+            for op in cr.judge_opinions
+        ])
+        dissent = (
+            "<details>\n"
+            "<summary>⚖️ Dissent Summary (score variance &gt; 2)</summary>\n"
+            "\n"
+            f"{cr.dissent_summary}\n"
+            "\n"
+            "</details>\n"
+            "\n"
+        ) if cr.dissent_summary else ""
+        # One rendered block — and one buffer write — per criterion.
+        write(
+            f"### {cr.dimension_name}\n"
+            "\n"
+            f"**Final Score: {cr.final_score}/5** `[{score_bar}]`\n"
+            "\n"
+            "| Judge | Score | Argument (excerpt) |\n"
+            "|---|:---:|---|\n"
+            f"{rows}"
+            "\n"
+            f"{dissent}"
+            f"> **Remediation:** {cr.remediation}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+    write("## Remediation Plan\n\n")
+    write(report.remediation_plan)
+
+    return _IO_POOL.submit(_write_report, output_path, buf.getvalue())
 
-        lines += [
-            f"> **Remediation:** {cr.remediation}",
-            "",
-            "---",
-            "",
-        ]
 
-    lines += [
-        "## Remediation Plan",
-        "",
-        report.remediation_plan,
-    ]
+def _write_report(output_path: Path, text: str) -> Path:
+    """Write rendered Markdown to *output_path* — runs on ``_IO_POOL``.
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    Raises ``OSError`` on failure; it surfaces through the returned Future.
+    """
+    # Encoded once up front and written through a binary handle — no
+    # TextIOWrapper / incremental encoder between the string and the file.
+    data = text.encode()
+    try:
+        output_path.write_bytes(data)
+    except FileNotFoundError:
+        # First report (or audit/ removed since): create the directory once
+        # here rather than stat-ing it before every write.
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
     logger.info("[ChiefJustice] Report written → %s", output_path)
     return output_path
 
@@ -455,9 +532,9 @@ def _group_opinions(
     If a judge submitted multiple opinions for the same criterion (shouldn't
     happen but defensively handled), the last one wins.
     """
-    grouped: dict[str, dict[str, JudicialOpinion]] = {}
+    grouped: defaultdict[str, dict[str, JudicialOpinion]] = defaultdict(dict)
     for op in opinions:
-        grouped.setdefault(op.criterion_id, {})[op.judge] = op
+        grouped[op.criterion_id][op.judge] = op
     return grouped
 
 
@@ -486,8 +563,8 @@ def chief_justice_node(state: AgentState) -> dict[str, Any]:
     Returns
     -------
     dict
-        ``{"final_report": AuditReport}`` — written into ``AgentState.final_report``.
-        The report is also serialised to ``audit/<repo>_<timestamp>.md``.
+        ``{"final_report": AuditReport, "final_report_write": Future[Path]}`` —
+        the Future resolves once ``audit/<repo>_<timestamp>.md`` is written.
     """
     opinions: list[JudicialOpinion] = state.get("opinions", [])  # type: ignore[call-overload]
     evidences: dict[str, list[Evidence]] = state.get("evidences", {})  # type: ignore[call-overload]
@@ -527,12 +604,12 @@ def chief_justice_node(state: AgentState) -> dict[str, Any]:
             continue
 
         criterion_evidences = evidences.get(criterion_id, [])
-        scores = [prosecutor.score, defense.score, tech_lead.score]
-        variance = max(scores) - min(scores)
+        p, d, tl = prosecutor.score, defense.score, tech_lead.score
+        variance = max(p, d, tl) - min(p, d, tl)
 
         # Apply deterministic synthesis rules
         final_score, applied_rules = _synthesize_score(
-            criterion_id, prosecutor, defense, tech_lead, criterion_evidences
+            criterion_id, prosecutor, defense, tech_lead, criterion_evidences, variance
         )
 
         # Dissent summary — mandatory when variance > threshold
@@ -558,16 +635,17 @@ def chief_justice_node(state: AgentState) -> dict[str, Any]:
             )
         )
 
-        logger.info(
-            "[ChiefJustice] criterion=%-35s P=%d D=%d TL=%d variance=%d → final=%d  rules=%s",
-            criterion_id,
-            prosecutor.score,
-            defense.score,
-            tech_lead.score,
-            variance,
-            final_score,
-            [r.split(":")[0] for r in applied_rules],
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[ChiefJustice] criterion=%-35s P=%d D=%d TL=%d variance=%d → final=%d  rules=%s",
+                criterion_id,
+                p,
+                d,
+                tl,
+                variance,
+                final_score,
+                [r.split(":")[0] for r in applied_rules],
+            )
 
     if not criteria_results:
         logger.error("[ChiefJustice] No criteria results produced — cannot render verdict")
@@ -588,15 +666,11 @@ def chief_justice_node(state: AgentState) -> dict[str, Any]:
         remediation_plan=remediation_plan,
     )
 
-    output_path = _serialize_to_markdown(report)
+    report_write = _serialize_to_markdown(report)
 
-    logger.info(
-        "[ChiefJustice] Verdict rendered. overall_score=%.2f/5.0 | report=%s",
-        overall_score,
-        output_path,
-    )
+    logger.info("[ChiefJustice] Verdict rendered. overall_score=%.2f/5.0", overall_score)
 
-    return {"final_report": report}
+    return {"final_report": report, "final_report_write": report_write}
 
 
 # ---------------------------------------------------------------------------
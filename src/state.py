@@ -24,6 +24,8 @@ Reducers
 --------
 ``operator.ior``  ( ``|=`` on dicts )  lets each Detective write its
 evidence keyed by ``criterion_id`` without clobbering sibling Detectives.
+The merge is in place, so each update costs only the keys it writes —
+no intermediate dict is materialised per branch.
 
 ``operator.add``  ( ``+``  on lists )  lets each Judge append its
 ``JudicialOpinion`` without clobbering sibling Judges.
@@ -32,9 +34,14 @@ evidence keyed by ``criterion_id`` without clobbering sibling Detectives.
 from __future__ import annotations
 
 import operator
+import sys
+
+# Runtime imports: LangGraph resolves AgentState's annotations with get_type_hints.
+from concurrent.futures import Future  # noqa: TC003
+from pathlib import Path  # noqa: TC003
 from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing_extensions import TypedDict
 
 # ---------------------------------------------------------------------------
@@ -113,6 +120,12 @@ class Evidence(BaseModel):
         description="The RubricDimension.id this evidence was collected for",
     )
 
+    @field_validator("criterion_id")
+    @classmethod
+    def _intern_criterion_id(cls, value: str) -> str:
+        """Intern the id — it is used as a dict key throughout the graph."""
+        return sys.intern(value)
+
 
 # ---------------------------------------------------------------------------
 # Judicial Layer — output models
@@ -136,6 +149,8 @@ class JudicialOpinion(BaseModel):
                     supporting this opinion.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     judge: Literal["Prosecutor", "Defense", "TechLead"] = Field(
         description="The judicial persona rendering this opinion"
     )
@@ -156,6 +171,30 @@ class JudicialOpinion(BaseModel):
         ),
     )
 
+    @field_validator("criterion_id")
+    @classmethod
+    def _intern_criterion_id(cls, value: str) -> str:
+        """Intern the id — it is used as a dict key throughout the graph."""
+        return sys.intern(value)
+
+
+class JudgePanelVerdict(BaseModel):
+    """One Judge's opinions on several criteria, returned by a single LLM call.
+
+    Used when a judge batches its criteria into one request; the opinions
+    are unpacked into ``AgentState.opinions`` individually.
+
+    Fields
+    ------
+    opinions  One ``JudicialOpinion`` per criterion, matched by ``criterion_id``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    opinions: list[JudicialOpinion] = Field(
+        description="One opinion per criterion, each tagged with its criterion_id",
+    )
+
 
 # ---------------------------------------------------------------------------
 # Supreme Court — output models
@@ -311,10 +350,21 @@ class AgentState(TypedDict):
     ``evidence_aggregator_node`` to cross-reference paths claimed in the PDF
     report.  Not Annotated — only one node writes to this field."""
 
+    repo_files_norm: frozenset[str]
+    """``repo_files`` with backslashes converted and leading ``./`` stripped,
+    written by ``repo_investigator_node`` alongside ``repo_files`` so the
+    aggregator's cross-reference is a plain set lookup.  Empty when the
+    clone fails."""
+
     # ── Supreme Court output ────────────────────────────────────────────────
     final_report: Optional[AuditReport]
     """The fully synthesised audit report; ``None`` until ChiefJusticeNode runs."""
 
+    final_report_write: Future[Path] | None
+    """Pending write of ``final_report`` to ``audit/<repo>_<ts>.md``, resolving
+    to the report path.  ``result()`` waits for the file and re-raises a
+    failed write; ``None`` when no report was rendered."""
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -327,6 +377,7 @@ __all__: List[str] = [
     "Evidence",
     # Judicial layer
     "JudicialOpinion",
+    "JudgePanelVerdict",
     # Supreme Court
     "CriterionResult",
     "AuditReport",
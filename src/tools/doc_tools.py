@@ -40,10 +40,12 @@ The "RAG-lite" pipeline
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -54,23 +56,36 @@ from src.state import Evidence
 # ---------------------------------------------------------------------------
 
 # Matches patterns like src/state.py, src/nodes/judges.py, src/tools/repo_tools.py
-# Also captures paths quoted with backticks or inside "…"
+# Paths quoted with backticks or inside "…" match too — the quote characters
+# fall outside the character classes.  No optional quote groups around the
+# path: they never change a match but make the engine try and backtrack
+# them at every position of a multi-megabyte text (~2.5× slower).
 _FILE_PATH_RE = re.compile(
     r"""
-    (?:                          # optional surrounding quote characters
-        [`"']?
-    )
-    (                            # capture group 1: the path itself
-        (?:src|tests?|docs?|scripts?)  # must start with a known top-level dir
-        /                        # first separator
-        [\w./\-]+                # path body (word chars, dots, slashes, dashes)
-        \.(?:py|json|toml|md|txt|yaml|yml)  # must end with a known extension
-    )
-    (?:[`"']?)                   # optional closing quote
+    (?:src|tests?|docs?|scripts?)  # must start with a known top-level dir
+    /                              # first separator
+    [\w./\-]+                      # path body (word chars, dots, slashes, dashes)
+    \.(?:py|json|toml|md|txt|yaml|yml)  # must end with a known extension
     """,
     re.VERBOSE,
 )
 
+# PDF ingest strategy: "pypdfium" (default) extracts text directly with no
+# model weights; "docling" runs docling's structural converter (with
+# HybridChunker chunks) and falls back to pypdfium on any failure.
+_PDF_BACKEND = os.environ.get("AUDITOR_PDF_BACKEND", "pypdfium").lower()
+
+# OCR in the docling converter — off unless explicitly requested (AUDITOR_PDF_OCR=1)
+_PDF_OCR = os.environ.get("AUDITOR_PDF_OCR", "0") == "1"
+
+# Thread budget for docling's torch/OpenMP pools: half the cores, leaving the
+# rest to the concurrently running detective branches.  Beyond ~4 threads
+# docling's layout models scale poorly.  An explicit OMP_NUM_THREADS wins.
+_DOCLING_THREADS = str(max(1, (os.cpu_count() or 2) // 2))
+
+# Backslash → slash in one C-level pass when normalising paths for comparison
+_BSLASH_TRANS = str.maketrans("\\", "/")
+
 # Substantiveness indicators: terms that signal genuine explanation rather
 # than keyword-dropping
 _SUBSTANTIVE_VERBS = frozenset(
@@ -199,6 +214,35 @@ class _AuditorState:
     ingested: bool = False
 
 
+@functools.lru_cache(maxsize=1)
+def _docling_converter() -> Any:
+    """Return the process-wide docling ``DocumentConverter``.
+
+    The converter holds no per-document state but caches its initialised
+    pipeline (and the layout models it loads), so building it once lets
+    every later audit in the process skip that start-up cost.
+    """
+    # Must precede the first docling/torch import, which sizes the pools
+    os.environ.setdefault("OMP_NUM_THREADS", _DOCLING_THREADS)
+
+    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend  # type: ignore[import]
+    from docling.document_converter import DocumentConverter, PdfFormatOption  # type: ignore[import]
+    from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore[import]
+
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = _PDF_OCR         # skip RapidOCR / layout-model download
+    pipeline_options.do_table_structure = False  # lighter parse, still extracts all text
+
+    return DocumentConverter(
+        format_options={
+            "pdf": PdfFormatOption(
+                pipeline_options=pipeline_options,
+                backend=PyPdfiumDocumentBackend,
+            )
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # DocumentAuditor — the main class
 # ---------------------------------------------------------------------------
@@ -224,18 +268,26 @@ class DocumentAuditor:
         "State Synchronization",
     )
 
+    # Ingest backend in effect (AUDITOR_PDF_BACKEND) — part of the evidence-cache key
+    PDF_BACKEND: str = _PDF_BACKEND
+
     def __init__(self) -> None:
         self._state = _AuditorState()
+        self.substantive_term_count: int = 0
+        """Number of required terms explained substantively.  Populated by
+        ``build_theoretical_depth_evidence()``; read by ``doc_analyst_node``
+        for logging without re-scanning the Evidence content."""
 
     # ── Ingestion ──────────────────────────────────────────────────────────
 
     def ingest(self, pdf_path: str) -> None:
         """Parse *pdf_path* and build the internal chunk index.
 
-        Uses docling's ``DocumentConverter`` as the primary parser for PDF
-        files.  For non-PDF files (Markdown, plain text, etc.) the fallback
-        plain-text parser is used directly — docling model weights are NOT
-        downloaded in this path, keeping the hot path fast.
+        PDFs are text-extracted with pypdfium2 by default; set
+        ``AUDITOR_PDF_BACKEND=docling`` to use docling's ``DocumentConverter``
+        (pypdfium backend) instead.  For non-PDF files (Markdown, plain text,
+        etc.) the plain-text parser is used directly — docling model weights
+        are NOT downloaded in this path, keeping the hot path fast.
 
         Parameters
         ----------
@@ -251,10 +303,14 @@ class DocumentAuditor:
         if not path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        # Use pypdfium2 (bundled with docling) for PDF text extraction —
+        # Default: pypdfium2 (bundled with docling) for PDF text extraction —
         # no layout-model download required.  Docling's full converter is
-        # intentionally skipped to avoid the cas-bridge.xethub.hf.co timeout.
-        full_text, chunks = self._fallback_parse(path)
+        # opt-in (AUDITOR_PDF_BACKEND=docling) to avoid the
+        # cas-bridge.xethub.hf.co timeout and its much slower, heavier parse.
+        if _PDF_BACKEND == "docling" and path.suffix.lower() == ".pdf":
+            full_text, chunks = self._parse_with_docling(path)
+        else:
+            full_text, chunks = self._fallback_parse(path)
         self._state.full_text = full_text
         self._state.chunks = chunks
         self._state.source_path = str(path)
@@ -277,20 +333,11 @@ class DocumentAuditor:
         2. Attempt to use ``HybridChunker`` for semantic chunking.
         3. Fall back to paragraph splitting if the chunker is unavailable.
 
-        Uses a lightweight pipeline (OCR and table-structure disabled) to
-        avoid downloading heavy layout-model weights on every invocation.
+        Uses a lightweight pipeline (table structure disabled, and OCR off
+        unless ``AUDITOR_PDF_OCR=1``) on the pypdfium backend, which parses
+        markedly faster and with a fraction of the native backend's memory.
         """
-        from docling.document_converter import DocumentConverter, PdfFormatOption  # type: ignore[import]
-        from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore[import]
-
-        pipeline_options = PdfPipelineOptions()
-        pipeline_options.do_ocr = False            # skip RapidOCR / layout-model download
-        pipeline_options.do_table_structure = False  # lighter parse, still extracts all text
-
-        converter = DocumentConverter(
-            format_options={"pdf": PdfFormatOption(pipeline_options=pipeline_options)}
-        )
-        result = converter.convert(str(path))
+        result = _docling_converter().convert(str(path))
         doc = result.document
         full_text: str = doc.export_to_markdown()
 
@@ -466,12 +513,12 @@ class DocumentAuditor:
             (e.g. ``["src/state.py", "src/tools/repo_tools.py", …]``).
         """
         claimed = self.extract_file_paths()
-        normalised_repo = {f.replace("\\", "/").lstrip("./") for f in repo_files}
+        normalised_repo = {f.translate(_BSLASH_TRANS).lstrip("./") for f in repo_files}
 
         verified: list[str] = []
         hallucinated: list[str] = []
         for path in claimed:
-            normalised = path.replace("\\", "/").lstrip("./")
+            normalised = path.translate(_BSLASH_TRANS).lstrip("./")
             (verified if normalised in normalised_repo else hallucinated).append(path)
 
         rate = len(hallucinated) / len(claimed) if claimed else 0.0
@@ -498,6 +545,7 @@ class DocumentAuditor:
         }
         found_present = {term for term, r in results.items() if r.found}
         missing = set(self.REQUIRED_TERMS) - found_present
+        self.substantive_term_count = len(found_substantive)
 
         all_substantive = len(found_substantive) == len(self.REQUIRED_TERMS)
         any_found = bool(found_present)
@@ -7,6 +7,8 @@ Four-layer design
                        analysis output is typed, serialisable, and inspectable.
 2. RepoManager       — Context-managed, sandboxed workspace.  Cloned code
                        *never* touches the live project directory.
+   RepoCache         — Optional persistent clone cache, refreshed by
+                       shallow fetch, so repeat audits skip a full clone.
 3. GraphForensics    — Stateless, pure-utility class.  Accepts file Paths and
                        returns typed result models using Python's ``ast`` module
                        exclusively (no regex on code).
@@ -20,25 +22,39 @@ Security contract
 * Repository URL validated via ``urllib.parse`` before any syscall.
 * All git operations run inside ``tempfile.TemporaryDirectory``; the sandbox
   is cleaned up automatically on context-manager exit even if an exception
-  is raised.
+  is raised.  The one exception is ``RepoCache``, whose checkouts live in a
+  dedicated cache directory outside the project and are never executed.
 * No ``os.system`` calls anywhere in this module.
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
+import shutil
 import subprocess
 import tempfile
+import time
 import urllib.parse
 from collections import defaultdict
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.state import Evidence
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - depends on the platform
+    fcntl = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Custom exceptions
 # ---------------------------------------------------------------------------
@@ -232,6 +248,29 @@ def _validate_repo_url(url: str) -> None:
         raise ValueError(f"No hostname found in URL: '{url}'")
 
 
+def remote_head(url: str) -> str | None:
+    """Return the commit hash the remote's ``HEAD`` points at, or ``None``.
+
+    Uses ``git ls-remote`` — a single ref advertisement, no object
+    transfer — so callers can key cached results on the exact revision
+    before paying for a clone.  Any failure (bad URL, network, timeout)
+    yields ``None`` rather than raising.
+    """
+    try:
+        _validate_repo_url(url)
+        result = subprocess.run(
+            ["git", "ls-remote", url, "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30,
+        )
+    except (ValueError, OSError, subprocess.SubprocessError):
+        return None
+    head = result.stdout.split("\t", 1)[0].strip()
+    return head or None
+
+
 class RepoManager:
     """Context manager providing an isolated temporary workspace for git operations.
 
@@ -322,7 +361,8 @@ class RepoManager:
             ) from exc
         return dest
 
-    def git_log(self, repo_path: Path) -> list[CommitRecord]:
+    @staticmethod
+    def git_log(repo_path: Path) -> list[CommitRecord]:
         """Extract the full (shallow) commit history, oldest-first.
 
         Format string ``%H|%aI|%s`` gives: full hash, ISO-8601 author date,
@@ -366,6 +406,228 @@ class RepoManager:
                     continue
         return records
 
+    @staticmethod
+    def head_revision(repo_path: Path) -> str | None:
+        """Return the commit hash checked out at *repo_path*, or ``None`` on failure."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=repo_path,
+                timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout.strip() or None
+
+
+#: Root of the persistent clone cache (``AUDITOR_CLONE_CACHE_DIR`` overrides)
+_CLONE_CACHE_DIR: Path = Path(
+    os.environ.get("AUDITOR_CLONE_CACHE_DIR")
+    or Path.home() / ".cache" / "automaton-auditor" / "clones"
+)
+
+#: Size cap for the clone cache in MiB; ``AUDITOR_CLONE_CACHE_MB=0`` disables it
+_CLONE_CACHE_MAX_BYTES: int = int(os.environ.get("AUDITOR_CLONE_CACHE_MB", "5120")) * 1024 * 1024
+
+#: Without ``fcntl`` locks, entries used this recently are never evicted
+_CLONE_EVICT_MIN_AGE_SECONDS: float = 3600.0
+
+
+def _run_git(args: list[str], cwd: Path | None = None, timeout: int = 180) -> None:
+    """Run one git command; any failure or timeout surfaces as ``CloneError``."""
+    try:
+        subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+            timeout=timeout,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise CloneError(
+            f"git {args[0]} failed.\nstderr: {exc.stderr.strip()}"
+        ) from exc
+    except subprocess.TimeoutExpired as exc:
+        raise CloneError(f"git {args[0]} timed out after {timeout} s.") from exc
+
+
+@contextmanager
+def _entry_lock(lock_path: Path, *, blocking: bool = True) -> Iterator[bool]:
+    """Hold an exclusive ``flock`` on *lock_path* for the ``with`` block.
+
+    Yields False when the lock could not be taken (non-blocking and busy,
+    or the lock file is unusable).  Without ``fcntl`` it always yields True.
+    """
+    if fcntl is None:
+        yield True
+        return
+    try:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        yield False
+        return
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        yield True
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def _tree_size(path: Path) -> int:
+    """Return the total size in bytes of the regular files under *path*."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+class RepoCache:
+    """Persistent, size-bounded cache of shallow clones keyed on ``(url, ref)``.
+
+    A cache hit refreshes the existing checkout with a shallow ``git fetch``
+    plus ``git reset --hard FETCH_HEAD`` instead of re-downloading the whole
+    history, so repeat audits of a repository only transfer new commits.
+    Entries are evicted least-recently-used once the cache exceeds its cap.
+
+    Each entry ``<key>/`` has two siblings: ``<key>.lock``, an exclusive
+    ``flock`` held for as long as an audit uses the checkout, and
+    ``<key>.size``, its size in bytes recorded after every clone or fetch.
+    Concurrent audits of one URL therefore take turns, eviction skips
+    entries in use, and sizing the cache never walks every clone.
+
+    Example
+    -------
+    >>> with RepoCache().checkout("https://github.com/user/repo") as path:
+    ...     ...  # analyse the working tree at ``path``
+    """
+
+    def __init__(
+        self,
+        root: Path = _CLONE_CACHE_DIR,
+        max_bytes: int = _CLONE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+    @contextmanager
+    def checkout(self, url: str, ref: str = "HEAD", depth: int = 100) -> Iterator[Path | None]:
+        """Yield a working tree of *url* at *ref*, cloning or refreshing as needed.
+
+        The entry stays locked until the ``with`` block exits, so no other
+        audit refreshes or evicts the tree while it is being analysed.
+
+        Parameters
+        ----------
+        url:
+            Remote repository URL (validated before any subprocess call).
+        ref:
+            Branch or tag to check out; ``"HEAD"`` follows the remote default.
+        depth:
+            Shallow depth, matching ``RepoManager.clone`` so the git-history
+            protocol sees the same commits either way.
+
+        Yields
+        ------
+        Path | None
+            The cached working tree, or ``None`` when the cache is disabled or
+            its directory is unusable — callers then fall back to a
+            ``RepoManager`` sandbox.
+
+        Raises
+        ------
+        CloneError
+            If the remote cannot be cloned.
+        """
+        _validate_repo_url(url)
+        if self.max_bytes <= 0:
+            yield None
+            return
+        key = hashlib.sha256(f"{url.rstrip('/')}@{ref}".encode()).hexdigest()
+        dest = self.root / key
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            yield None
+            return
+
+        # Advisory: an unusable lock file must not stop the audit itself
+        with _entry_lock(self.root / f"{key}.lock"):
+            refreshed = False
+            if (dest / ".git").is_dir():
+                try:
+                    _run_git(["fetch", "--depth", str(depth), "origin", ref], cwd=dest)
+                    _run_git(["reset", "--hard", "FETCH_HEAD"], cwd=dest, timeout=60)
+                    _run_git(["clean", "-ffdx"], cwd=dest, timeout=60)
+                    refreshed = True
+                except CloneError:
+                    pass  # stale or corrupt entry — re-clone from scratch below
+            if not refreshed:
+                shutil.rmtree(dest, ignore_errors=True)
+                branch = [] if ref == "HEAD" else ["--branch", ref]
+                try:
+                    _run_git(["clone", "--depth", str(depth), *branch, url, str(dest)])
+                except CloneError:
+                    shutil.rmtree(dest, ignore_errors=True)
+                    raise
+
+            # Recency for LRU eviction — explicit, as atime is often disabled
+            try:
+                (self.root / f"{key}.size").write_text(str(_tree_size(dest)))
+                os.utime(dest)
+                self._evict(keep=dest)
+            except OSError:
+                pass  # eviction is best-effort; the checkout itself is valid
+            yield dest
+
+    def _entry_size(self, entry: Path) -> int:
+        """Return *entry*'s recorded size, measuring it once if unrecorded."""
+        size_file = entry.with_name(f"{entry.name}.size")
+        try:
+            return int(size_file.read_text())
+        except (OSError, ValueError):
+            size = _tree_size(entry)
+            size_file.write_text(str(size))
+            return size
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least-recently-used entries until the cache fits its cap.
+
+        Entries locked by another audit are skipped; without ``fcntl``,
+        so is any entry used in the last ``_CLONE_EVICT_MIN_AGE_SECONDS``.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for entry in self.root.iterdir():
+            if not entry.is_dir():
+                continue
+            size = self._entry_size(entry)
+            entries.append((entry.stat().st_mtime, size, entry))
+            total += size
+        cutoff = time.time() - _CLONE_EVICT_MIN_AGE_SECONDS
+        for mtime, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry == keep or (fcntl is None and mtime > cutoff):
+                continue
+            with _entry_lock(entry.with_name(f"{entry.name}.lock"), blocking=False) as locked:
+                if not locked:
+                    continue  # in use by a concurrent audit
+                shutil.rmtree(entry, ignore_errors=True)
+                entry.with_name(f"{entry.name}.size").unlink(missing_ok=True)
+            total -= size
+
 
 # ---------------------------------------------------------------------------
 # Layer 3 — GraphForensics: stateless AST-analysis utility
@@ -791,6 +1053,11 @@ def _string_from_arg(node: ast.expr) -> str:
 # Layer 4 — RepoInvestigator: high-level forensic facade
 # ---------------------------------------------------------------------------
 
+# File types catalogued for report-accuracy cross-referencing
+_SOURCE_SUFFIXES: frozenset[str] = frozenset(
+    {".py", ".json", ".toml", ".md", ".txt", ".yaml", ".yml"}
+)
+
 
 class RepoInvestigator:
     """Orchestrates RepoManager and GraphForensics to produce Evidence objects.
@@ -803,76 +1070,110 @@ class RepoInvestigator:
     >>> investigator = RepoInvestigator("https://github.com/user/repo")
     >>> evidence_map = investigator.run_all()
     >>> # Dict[criterion_id, List[Evidence]] — ready for AgentState.evidences
+
+    Pass a ``RepoCache`` as ``cache`` to analyse its persistent checkout
+    instead of cloning into a fresh sandbox.
     """
 
-    def __init__(self, repo_url: str) -> None:
+    #: Criteria produced by ``_investigate_checkout`` — and, on clone failure,
+    #: by the failure map, so the aggregator sees the same keys either way
+    CRITERIA: tuple[str, ...] = (
+        "git_forensic_analysis",
+        "state_management_rigor",
+        "graph_orchestration",
+        "safe_tool_engineering",
+        "structured_output_enforcement",
+        "chief_justice_synthesis",
+        "judicial_nuance",
+    )
+
+    def __init__(self, repo_url: str, cache: RepoCache | None = None) -> None:
         _validate_repo_url(repo_url)
         self.repo_url = repo_url
+        self.cache = cache
         self._forensics = GraphForensics()
         self.repo_files: list[str] = []
         """Flat list of POSIX-style relative paths for every source file found
         in the cloned repository.  Populated by ``run_all()``; consumed by the
         ``evidence_aggregator_node`` for report-accuracy cross-referencing."""
+        self.revision: str | None = None
+        """Commit hash the protocols actually analysed; set by ``run_all()``.
+        ``None`` when the clone failed or ``git rev-parse`` did not resolve."""
 
     def run_all(self) -> dict[str, list[Evidence]]:
         """Clone once, run all protocols, return criterion-keyed Evidence map.
 
+        With a ``cache`` the protocols run against its checkout; when there is
+        none, or ``RepoCache.checkout`` yields ``None`` (cache disabled or
+        unusable), the repo is cloned into a ``RepoManager`` sandbox instead.
+
         The returned dict is safe to merge directly into ``AgentState.evidences``
-        via the ``operator.ior`` reducer.  A ``CloneError`` is captured and
-        surfaced as an Evidence object so the graph can continue gracefully.
+        via the ``operator.ior`` reducer.  A ``CloneError`` on either path is
+        captured and surfaced as failure Evidence for every criterion in
+        ``CRITERIA``, so the graph can continue gracefully.
         """
         try:
-            with RepoManager() as mgr:
-                repo_path = mgr.clone(self.repo_url)
-                commits = mgr.git_log(repo_path)
-                # Collect all source files for cross-referencing before tmpdir exits
-                self.repo_files = sorted(
-                    str(f.relative_to(repo_path)).replace("\\", "/")
-                    for f in repo_path.rglob("*")
-                    if f.is_file()
-                    and not any(part.startswith(".") for part in f.relative_to(repo_path).parts)
-                    and f.suffix in (".py", ".json", ".toml", ".md", ".txt", ".yaml", ".yml")
-                )
-                return {
-                    "git_forensic_analysis": [
-                        self._investigate_git_history(commits)
-                    ],
-                    "state_management_rigor": [
-                        self._investigate_state_management(repo_path)
-                    ],
-                    "graph_orchestration": [
-                        self._investigate_graph_orchestration(repo_path)
-                    ],
-                    "safe_tool_engineering": [
-                        self._investigate_tool_safety(repo_path)
-                    ],
-                    "structured_output_enforcement": [
-                        self._investigate_structured_output(repo_path)
-                    ],
-                    "chief_justice_synthesis": [
-                        self._investigate_chief_justice_synthesis(repo_path)
-                    ],
-                    "judicial_nuance": [
-                        self._investigate_judicial_nuance(repo_path)
-                    ],
-                }
+            with (
+                self.cache.checkout(self.repo_url)
+                if self.cache is not None
+                else nullcontext(None)
+            ) as local_path:
+                if local_path is not None:
+                    return self._investigate_checkout(local_path)
+                with RepoManager() as mgr:
+                    return self._investigate_checkout(mgr.clone(self.repo_url))
         except CloneError as exc:
-            return {
-                "git_forensic_analysis": [
-                    Evidence(
-                        goal="Clone repository and inspect all artifacts",
-                        found=False,
-                        content=str(exc),
-                        location=self.repo_url,
-                        rationale=(
-                            "Repository could not be cloned. "
-                            "All downstream forensic protocols are impossible."
-                        ),
-                        confidence=1.0,
-                        criterion_id="git_forensic_analysis",
-                    )
-                ]
-            }
+            failure_evidence = Evidence(
+                goal="Clone repository and inspect all artifacts",
+                found=False,
+                content=str(exc),
+                location=self.repo_url,
+                rationale=(
+                    "Repository could not be cloned. "
+                    "All downstream forensic protocols are impossible."
+                ),
+                confidence=1.0,
+                criterion_id="git_forensic_analysis",
+            )
+            return {criterion: [failure_evidence] for criterion in self.CRITERIA}
+
+    def _investigate_checkout(self, repo_path: Path) -> dict[str, list[Evidence]]:
+        """Run every protocol against the working tree at *repo_path*."""
+        self.revision = RepoManager.head_revision(repo_path)
+        commits = RepoManager.git_log(repo_path)
+        # Collect all source files for cross-referencing before tmpdir
+        # exits — cheap string tests first, the is_file() stat last
+        self.repo_files = sorted(
+            rel.as_posix()
+            for f in repo_path.rglob("*")
+            if f.suffix in _SOURCE_SUFFIXES
+            and (rel := f.relative_to(repo_path))  # Path objects are always truthy
+            and not any(part.startswith(".") for part in rel.parts)
+            and f.is_file()
+        )
+        return {
+            "git_forensic_analysis": [
+                self._investigate_git_history(commits)
+            ],
+            "state_management_rigor": [
+                self._investigate_state_management(repo_path)
+            ],
+            "graph_orchestration": [
+                self._investigate_graph_orchestration(repo_path)
+            ],
+            "safe_tool_engineering": [
+                self._investigate_tool_safety(repo_path)
+            ],
+            "structured_output_enforcement": [
+                self._investigate_structured_output(repo_path)
+            ],
+            "chief_justice_synthesis": [
+                self._investigate_chief_justice_synthesis(repo_path)
+            ],
+            "judicial_nuance": [
+                self._investigate_judicial_nuance(repo_path)
+            ],
+        }
 
     # ── Per-criterion private methods ──────────────────────────────────────
 
@@ -1303,8 +1604,11 @@ __all__: list[str] = [
     "GraphStructureReport",
     "ToolSafetyReport",
     "StructuredOutputReport",
+    # Helpers
+    "remote_head",
     # Core classes
     "RepoManager",
+    "RepoCache",
     "GraphForensics",
     "RepoInvestigator",
 ]
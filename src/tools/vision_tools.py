@@ -28,6 +28,7 @@ Rubric criterion evaluated
 from __future__ import annotations
 
 import base64
+import functools
 import io
 import logging
 import os
@@ -105,6 +106,9 @@ class VisionInspector:
     #: Maximum pages to render and analyse (cost/latency guard)
     MAX_PAGES: int = 6
 
+    #: Vision requests in flight at once (provider rate-limit guard)
+    MAX_CONCURRENCY: int = 4
+
     def __init__(self) -> None:
         self._pages_b64: list[tuple[int, str]] = []  # [(page_no, b64_png)]
         self._pdf_path: str = ""
@@ -217,7 +221,7 @@ class VisionInspector:
     # ── Vision analysis ────────────────────────────────────────────────────
 
     def analyze_diagrams(self) -> list[DiagramAnalysis]:
-        """Call Claude claude-haiku vision on each rendered page.
+        """Call Claude claude-haiku vision on each rendered page, concurrently.
 
         Returns
         -------
@@ -232,38 +236,51 @@ class VisionInspector:
         if llm is None:
             return []
 
-        analyses: list[DiagramAnalysis] = []
-        for page_no, b64 in self._pages_b64:
-            try:
-                from langchain_core.messages import HumanMessage  # type: ignore[import]
-
-                response = llm.invoke(
-                    [
-                        HumanMessage(
-                            content=[
-                                {"type": "text", "text": _VISION_PROMPT},
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/png;base64,{b64}"
-                                    },
-                                },
-                            ]
-                        )
+        from langchain_core.messages import HumanMessage  # type: ignore[import]
+
+        # One request per page, issued concurrently via Runnable.batch so the
+        # per-page round-trips overlap instead of adding up.
+        requests = [
+            [
+                HumanMessage(
+                    content=[
+                        {"type": "text", "text": _VISION_PROMPT},
+                        {
+                            "type": "image_url",
+                            "image_url": {"url": f"data:image/png;base64,{b64}"},
+                        },
                     ]
                 )
-                analysis = _parse_vision_response(str(response.content), page_no)
-                analyses.append(analysis)
-                logger.debug(
-                    "[VisionInspector] Page %d → has_diagram=%s assessment=%s",
-                    page_no,
-                    analysis.has_diagram,
-                    analysis.assessment,
+            ]
+            for _, b64 in self._pages_b64
+        ]
+        responses = llm.batch(
+            requests,
+            config={"max_concurrency": self.MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+
+        analyses: list[DiagramAnalysis] = []
+        for (page_no, _), response in zip(self._pages_b64, responses, strict=True):
+            if isinstance(response, Exception):
+                logger.warning(
+                    "[VisionInspector] Vision call failed for page %d: %s", page_no, response
                 )
+                continue
+            try:
+                analysis = _parse_vision_response(str(response.content), page_no)
             except Exception as exc:
                 logger.warning(
                     "[VisionInspector] Vision call failed for page %d: %s", page_no, exc
                 )
+                continue
+            analyses.append(analysis)
+            logger.debug(
+                "[VisionInspector] Page %d → has_diagram=%s assessment=%s",
+                page_no,
+                analysis.has_diagram,
+                analysis.assessment,
+            )
 
         return analyses
 
@@ -364,18 +381,23 @@ class VisionInspector:
 
 
 def _build_vision_llm() -> Any | None:
-    """Build a Claude claude-haiku LLM instance for vision analysis, or return None."""
+    """Return the Claude claude-haiku LLM for vision analysis, or None if unavailable."""
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        logger.warning("[VisionInspector] ANTHROPIC_API_KEY not set — skipping vision analysis")
+        return None
+    return _vision_llm_for(api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _vision_llm_for(api_key: str) -> Any | None:
+    """Build the vision LLM once per API key; its HTTP client is reused across audits."""
     try:
         from langchain_anthropic import ChatAnthropic  # type: ignore[import]
     except ImportError:
         logger.warning("[VisionInspector] langchain_anthropic not installed")
         return None
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        logger.warning("[VisionInspector] ANTHROPIC_API_KEY not set — skipping vision analysis")
-        return None
-
     try:
         return ChatAnthropic(
             model="claude-haiku-4-5-20251001",
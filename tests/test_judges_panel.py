@@ -0,0 +1,81 @@
+"""Tests for matching a batched JudgePanelVerdict back onto its criteria."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.nodes import judges
+from src.state import JudgePanelVerdict, JudicialOpinion
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def _opinion(criterion_id: str, score: int, argument: str) -> JudicialOpinion:
+    return JudicialOpinion(
+        judge="Defense",
+        criterion_id=criterion_id,
+        score=score,
+        argument=argument,
+        cited_evidence=[],
+    )
+
+
+def _panel(
+    monkeypatch: pytest.MonkeyPatch,
+    opinions: list[JudicialOpinion],
+    asked: list[str],
+) -> list[JudicialOpinion | None]:
+    """Run ``_run_panel`` for *asked* with the LLM replying *opinions*."""
+    monkeypatch.setattr(judges, "_get_panel_llm", lambda: None)
+    monkeypatch.setattr(
+        judges,
+        "_invoke_with_retry",
+        lambda *_args: JudgePanelVerdict(opinions=opinions),
+    )
+    return judges._run_panel("Defense", asked, "panel prompt")
+
+
+def test_reordered_reply_is_matched_by_criterion_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = _panel(
+        monkeypatch,
+        [_opinion("b", 1, "about b"), _opinion("a", 5, "about a")],
+        ["a", "b"],
+    )
+    assert [(op.criterion_id, op.score, op.argument) for op in result] == [
+        ("a", 5, "about a"),
+        ("b", 1, "about b"),
+    ]
+
+
+def test_short_reply_leaves_missing_criteria_unanswered(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = _panel(monkeypatch, [_opinion("b", 2, "about b")], ["a", "b", "c"])
+    assert result[0] is None
+    assert result[1] is not None and result[1].argument == "about b"
+    assert result[2] is None
+
+
+def test_duplicate_ids_are_not_guessed(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = _panel(
+        monkeypatch,
+        [_opinion("a", 5, "first a"), _opinion("a", 1, "second a"), _opinion("c", 3, "about c")],
+        ["a", "b", "c"],
+    )
+    assert result[0] is None
+    assert result[1] is None
+    assert result[2] is not None and result[2].argument == "about c"
+
+
+def test_unknown_ids_fall_back_to_position(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = _panel(
+        monkeypatch,
+        [_opinion("x", 2, "first"), _opinion("y", 4, "second")],
+        ["a", "b"],
+    )
+    assert [(op.criterion_id, op.argument) for op in result] == [("a", "first"), ("b", "second")]
+
+
+def test_failed_call_leaves_every_criterion_unanswered(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(judges, "_get_panel_llm", lambda: None)
+    monkeypatch.setattr(judges, "_invoke_with_retry", lambda *_args: None)
+    assert judges._run_panel("Defense", ["a", "b"], "panel prompt") == [None, None]